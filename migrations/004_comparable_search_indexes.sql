@@ -0,0 +1,19 @@
+-- Taxdown - Comparable Search Indexes
+-- Migration: 004_comparable_search_indexes.sql
+-- Created: 2026-10-17
+-- Description: Composite index backing the candidate filters in ComparableService.find_comparables
+--
+-- The comparables query restricts candidates to active properties of the
+-- subject's type_, then to the same subdivname or a bounded total_val_cents
+-- range. Leading with type_ and subdivname serves the subdivision branch;
+-- total_val_cents lets the value-range branch be a range scan within the type.
+
+-- ============================================================================
+-- INDEXES
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_properties_type_subdiv_total_val
+    ON properties(type_, subdivname, total_val_cents)
+    WHERE is_active = true;
+
+ANALYZE properties;
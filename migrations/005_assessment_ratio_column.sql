@@ -0,0 +1,25 @@
+-- Taxdown - Stored Assessment Ratio
+-- Migration: 005_assessment_ratio_column.sql
+-- Created: 2026-10-17
+-- Description: Stores each property's assessed/total ratio (as a percentage) as a generated column
+--
+-- ComparableService computed ROUND(assess_val_cents / total_val_cents * 100, 2)
+-- for every candidate row on every comparables search. The stored column is
+-- computed once per write. It is only projected, never filtered or sorted on,
+-- so it is not indexed.
+
+-- ============================================================================
+-- COLUMNS
+-- ============================================================================
+
+ALTER TABLE properties
+    ADD COLUMN IF NOT EXISTS assessment_ratio_pct NUMERIC(7,2)
+    GENERATED ALWAYS AS (
+        CASE
+            WHEN total_val_cents > 0
+            THEN ROUND((assess_val_cents::NUMERIC / total_val_cents::NUMERIC) * 100, 2)
+            ELSE 0
+        END
+    ) STORED;
+
+COMMENT ON COLUMN properties.assessment_ratio_pct IS 'Assessed value as a percentage of total value (0-100), generated from the cents columns';
@@ -0,0 +1,27 @@
+-- Taxdown - Stored Property Geography
+-- Migration: 006_property_geography.sql
+-- Created: 2026-10-17
+-- Description: Adds an indexed geography copy of properties.geometry for distance searches
+--
+-- Comparable searches measure distances in meters on the spheroid, which needs
+-- geography. Casting geometry per row on every query cannot use the existing
+-- GiST index on geometry, so ST_DWithin radius searches scanned every
+-- candidate. geometry is already WGS84 (SRID 4326), so a plain cast suffices.
+
+-- ============================================================================
+-- COLUMNS
+-- ============================================================================
+
+ALTER TABLE properties
+    ADD COLUMN IF NOT EXISTS geog GEOGRAPHY(MultiPolygon, 4326)
+    GENERATED ALWAYS AS (geometry::geography) STORED;
+
+COMMENT ON COLUMN properties.geog IS 'Geography copy of geometry, generated; used for distance and radius searches';
+
+-- ============================================================================
+-- INDEXES
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_properties_geog ON properties USING GIST(geog);
+
+ANALYZE properties;
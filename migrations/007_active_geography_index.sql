@@ -0,0 +1,22 @@
+-- Taxdown - Active Property Geography Index
+-- Migration: 007_active_geography_index.sql
+-- Created: 2026-10-17
+-- Description: Restricts the geography GiST index to active properties
+--
+-- Every comparables search filters on is_active = true, and geog is only read
+-- by those searches. A partial index leaves inactive parcels out of the tree,
+-- so it is smaller and stays cached more easily. The (type_, subdivname, ...)
+-- candidate index from migration 004 is already partial on is_active.
+
+-- ============================================================================
+-- INDEXES
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_properties_geog_active
+    ON properties USING GIST(geog)
+    WHERE is_active = true;
+
+-- Superseded by idx_properties_geog_active
+DROP INDEX IF EXISTS idx_properties_geog;
+
+ANALYZE properties;
@@ -50,6 +50,11 @@ class APISettings(BaseSettings):
     database_url: str
     database_pool_size: int = 20
     database_max_overflow: int = 40
+    database_pool_recycle: int = 1800  # seconds before a pooled connection is replaced
+    # psycopg 3 (postgresql+psycopg://) only: executions before a statement is
+    # server-side prepared (0 = always). Leave unset behind PgBouncer in
+    # transaction pooling mode, which cannot keep prepared statements.
+    database_prepare_threshold: Optional[int] = None
 
     # Rate Limiting
     rate_limit_per_minute: int = 100
@@ -7,6 +7,7 @@ Provides dependency injection for database connections, services, and authentica
 from fastapi import Depends, HTTPException, Security
 from fastapi.security import APIKeyHeader
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import Session
 from typing import Generator, Optional
 
@@ -35,10 +36,23 @@ def get_engine():
         database_url = settings.database_url
         if database_url.startswith("postgres://"):
             database_url = database_url.replace("postgres://", "postgresql://", 1)
+        connect_args = {}
+        # Automatic server-side prepares are a psycopg 3 feature; psycopg2 has no equivalent
+        if settings.database_prepare_threshold is not None and database_url.startswith("postgresql+psycopg://"):
+            connect_args["prepare_threshold"] = settings.database_prepare_threshold
+        dialect_kwargs = {}
+        # psycopg2 otherwise runs executemany of text() statements one row per round-trip
+        if make_url(database_url).get_driver_name() == "psycopg2":
+            dialect_kwargs["executemany_mode"] = "values_plus_batch"
         _engine = create_engine(
             database_url,
             pool_size=settings.database_pool_size,
             max_overflow=settings.database_max_overflow,
+            pool_recycle=settings.database_pool_recycle,
+            pool_pre_ping=True,
+            pool_use_lifo=True,
+            connect_args=connect_args,
+            **dialect_kwargs,
         )
     return _engine
 
@@ -217,6 +217,7 @@ async def bulk_analyze(
     errors = 0
     appeal_candidates = 0
     total_savings_cents = 0
+    completed = []
 
     engine = get_engine()
 
@@ -231,11 +232,7 @@ async def bulk_analyze(
             analysis = analyzer.analyze_property(property_id=parcel_id)
 
             if analysis:
-                # Save analysis to database
-                try:
-                    analyzer.save_analysis(analysis)
-                except Exception as save_err:
-                    logger.warning(f"Failed to save bulk analysis for {parcel_id}: {save_err}")
+                completed.append(analysis)
 
                 # fair_assessed_value is 20% of median comparable market value
                 fair_assessed_cents = int(analysis.median_comparable_value_cents * 0.20) if analysis.median_comparable_value_cents else None
@@ -273,6 +270,14 @@ async def bulk_analyze(
             logger.error(f"Bulk analysis error for {property_id}: {e}")
             errors += 1
 
+    # Save all analyses to database; rows that cannot be saved are logged and skipped
+    try:
+        saved = analyzer.save_analyses(completed)
+        if saved < len(completed):
+            logger.warning(f"Saved {saved} of {len(completed)} bulk analyses")
+    except Exception as save_err:
+        logger.warning(f"Failed to save {len(completed)} bulk analyses: {save_err}")
+
     duration = time.time() - start_time
 
     return BulkAnalyzeResponse(
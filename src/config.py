@@ -3,7 +3,7 @@
 import os
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
 
 # Load environment variables from .env file
 load_dotenv()
@@ -31,10 +31,24 @@ def get_database_url(use_local: bool = False) -> str:
     return url
 
 
+# Pool options for long-running batch jobs such as analyze_county: a warm LIFO
+# pool that drops connections the server has closed before handing them out.
+# Pool size is left at SQLAlchemy's default (5 + 10 overflow).
+BATCH_POOL_OPTIONS = {
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+    "pool_use_lifo": True,
+}
+
+
 def get_engine(use_local: bool = False, **kwargs) -> Engine:
     """
     Create and return a SQLAlchemy engine.
 
+    Pool settings are SQLAlchemy's defaults unless passed in kwargs; each
+    engine owns its own pool, so create one per process and reuse it.
+    Long-running jobs can pass **BATCH_POOL_OPTIONS.
+
     Args:
         use_local: If True, connects to local database
         **kwargs: Additional arguments passed to create_engine
@@ -43,4 +57,7 @@ def get_engine(use_local: bool = False, **kwargs) -> Engine:
         SQLAlchemy Engine instance
     """
     url = get_database_url(use_local=use_local)
+    # psycopg2 otherwise runs executemany of text() statements one row per round-trip
+    if make_url(url).get_driver_name() == "psycopg2":
+        kwargs.setdefault("executemany_mode", "values_plus_batch")
     return create_engine(url, **kwargs)
@@ -48,7 +48,7 @@ except ImportError:
     print("WARNING: tqdm not installed. Progress bars will be disabled.")
     print("Install with: pip install tqdm")
 
-from src.config import get_engine
+from src.config import BATCH_POOL_OPTIONS, get_engine
 from src.services.assessment_analyzer import AssessmentAnalyzer, AssessmentAnalysis
 
 
@@ -523,7 +523,7 @@ def main():
     try:
         # Initialize database connection
         logger.info("Connecting to database...")
-        engine = get_engine()
+        engine = get_engine(**BATCH_POOL_OPTIONS)
 
         # Initialize analyzer
         logger.info(f"Initializing analyzer (mill_rate={args.mill_rate})...")
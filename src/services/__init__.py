@@ -21,10 +21,8 @@ from .savings_estimator import (
     SavingsEstimator,
     SavingsEstimate,
 )
-from .assessment_analyzer import (
-    AssessmentAnalyzer,
-    AssessmentAnalysis,
-)
+from .assessment_models import AssessmentAnalysis
+from .assessment_analyzer import AssessmentAnalyzer
 from .appeal_models import (
     GeneratorConfig,
     AppealPackage,
@@ -29,10 +29,12 @@ Usage:
 """
 
 import logging
-from datetime import datetime, date
-from typing import List, Optional, Dict, Any
-from decimal import Decimal
+from contextlib import nullcontext
+from datetime import date
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Tuple
 
+import orjson
 from sqlalchemy import text
 from sqlalchemy.engine import Engine, Connection
 from sqlalchemy.exc import SQLAlchemyError
@@ -47,12 +49,69 @@ from .appeal_models import (
     AppealStatus,
     TemplateStyle,
     GeneratorType,
+    batch_timestamp,
 )
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# SQL STATEMENTS
+# ============================================================================
+# Built once at import time and reused for every call.
+
+# Note: sq_ft and yr_built columns don't exist in the properties table yet
+# When those columns are added, they can be included in this query
+_GET_PROPERTY_DETAILS_SQL = text("""
+    SELECT
+        id,
+        parcel_id,
+        ph_add AS address,
+        ow_name AS owner_name,
+        ow_add AS owner_address,
+        total_val_cents,
+        assess_val_cents,
+        prop_class
+    FROM properties
+    WHERE parcel_id = :property_id OR id::text = :property_id
+    LIMIT 1
+""")
+
+_SAVE_APPEAL_SQL = text("""
+    INSERT INTO tax_appeals (
+        id,
+        property_id,
+        status,
+        original_assessed_value_cents,
+        requested_value_cents,
+        reduction_amount_cents,
+        appeal_letter_text,
+        success_probability,
+        created_at,
+        updated_at
+    ) VALUES (
+        :id,
+        CAST(:property_id AS uuid),
+        :status,
+        :original_value,
+        :requested_value,
+        :reduction_amount,
+        :appeal_letter,
+        :success_probability,
+        CURRENT_TIMESTAMP,
+        CURRENT_TIMESTAMP
+    )
+""")
+
+
+def _format_dollars(cents: int) -> str:
+    """Format integer cents as a dollar string (e.g. 123456 -> "$1,234.56") without float math."""
+    sign = "-" if cents < 0 else ""
+    dollars, remainder = divmod(abs(int(cents)), 100)
+    return f"${sign}{dollars:,}.{remainder:02d}"
+
+
 class AppealGenerationError(Exception):
     """Raised when appeal generation fails."""
     pass
@@ -108,8 +167,15 @@ class AppealGenerator:
         self.analyzer = AssessmentAnalyzer(db_connection, default_mill_rate=self.config.mill_rate)
         self.comparable_service = ComparableService(db_connection)
 
+        # Letter builders keyed by style; GeneratorConfig has already validated the style
+        self._letter_builders = {
+            TemplateStyle.FORMAL: self._generate_formal_letter,
+            TemplateStyle.DETAILED: self._generate_detailed_letter,
+            TemplateStyle.CONCISE: self._generate_concise_letter,
+        }
+
         logger.info(
-            f"AppealGenerator initialized with style={self.config.template_style}, "
+            f"AppealGenerator initialized with style={self.config.template_style.value}, "
             f"mill_rate={self.config.mill_rate}"
         )
 
@@ -135,7 +201,7 @@ class AppealGenerator:
             AppealGenerationError: If generation fails
         """
         cfg = config or self.config
-        logger.info(f"Generating appeal for property {property_id} with style={cfg.template_style}")
+        logger.info(f"Generating appeal for property {property_id} with style={cfg.template_style.value}")
 
         try:
             # Step 1: Analyze the property
@@ -195,7 +261,7 @@ class AppealGenerator:
             logger.debug(f"requested_assessed_cents = {requested_assessed_cents}, reduction_cents = {reduction_cents}")
 
             # Step 6: Generate appeal content
-            logger.debug(f"Step 6: Generating appeal letter with style={cfg.template_style}")
+            logger.debug(f"Step 6: Generating appeal letter with style={cfg.template_style.value}")
             try:
                 appeal_letter = self._generate_letter(analysis, property_data, cfg)
                 logger.debug(f"Appeal letter generated: {len(appeal_letter)} chars")
@@ -254,10 +320,9 @@ class AppealGenerator:
                 required_forms=["Written Statement of Appeal", "Evidence Documentation"],
                 statute_reference="Arkansas Code § 26-27-301",
 
-                # Metadata
-                generated_at=datetime.now(),
+                # Metadata (generated_at defaults to the shared batch timestamp)
                 generator_type=GeneratorType.CLAUDE_API.value if cfg.use_claude_api else GeneratorType.TEMPLATE.value,
-                template_style=cfg.template_style,
+                template_style=cfg.template_style.value,
                 status=AppealStatus.GENERATED.value,
             )
 
@@ -284,14 +349,20 @@ class AppealGenerator:
     def generate_batch(
         self,
         property_ids: List[str],
-        config: Optional[GeneratorConfig] = None
+        config: Optional[GeneratorConfig] = None,
+        output_path: Optional[Path] = None
     ) -> BatchAppealResult:
         """
         Generate appeals for multiple properties.
 
+        When output_path is given, each package is written to that file as one
+        JSON line as soon as it is generated and is not kept in result.appeals,
+        so memory stays flat for large batches.
+
         Args:
             property_ids: List of parcel IDs or property UUIDs
             config: Optional override configuration
+            output_path: Optional JSONL file to stream generated packages to
 
         Returns:
             BatchAppealResult with generated appeals and statistics
@@ -299,33 +370,45 @@ class AppealGenerator:
         cfg = config or self.config
         logger.info(f"Starting batch appeal generation for {len(property_ids)} properties")
 
-        result = BatchAppealResult(total_requested=len(property_ids))
-
-        for property_id in property_ids:
-            try:
-                package = self.generate_appeal(property_id, cfg)
-
-                if package:
-                    result.appeals.append(package)
-                    result.generated += 1
-                    result.total_potential_savings_cents += package.estimated_annual_savings_cents
-                else:
-                    result.skipped += 1
-
-            except PropertyNotFoundError as e:
-                result.errors += 1
-                result.error_details.append({
-                    'property_id': property_id,
-                    'error': 'Property not found',
-                    'message': str(e)
-                })
-            except Exception as e:
-                result.errors += 1
-                result.error_details.append({
-                    'property_id': property_id,
-                    'error': type(e).__name__,
-                    'message': str(e)
-                })
+        result = BatchAppealResult(total_requested=len(property_ids), output_path=output_path)
+        # orjson emits UTF-8 bytes, so the JSONL file is written in binary mode
+        sink = open(output_path, "wb") if output_path else nullcontext()
+
+        with sink as out, batch_timestamp(result.generated_at):
+            for property_id in property_ids:
+                try:
+                    package = self.generate_appeal(property_id, cfg)
+
+                    if package:
+                        if out is not None:
+                            out.write(orjson.dumps(package.to_dict()) + b"\n")
+                            result.total_potential_savings_cents += package.estimated_annual_savings_cents
+                        else:
+                            result.appeals.append(package)
+                        result.generated += 1
+                    else:
+                        result.skipped += 1
+
+                except PropertyNotFoundError as e:
+                    result.errors += 1
+                    result.error_details.append({
+                        'property_id': property_id,
+                        'error': 'Property not found',
+                        'message': str(e)
+                    })
+                except Exception as e:
+                    result.errors += 1
+                    result.error_details.append({
+                        'property_id': property_id,
+                        'error': type(e).__name__,
+                        'message': str(e)
+                    })
+
+        # Streamed packages were totalled as they were written; in-memory ones are summed once here
+        if output_path is None:
+            result.total_potential_savings_cents = sum(
+                package.estimated_annual_savings_cents for package in result.appeals
+            )
 
         logger.info(
             f"Batch generation complete: {result.generated} generated, "
@@ -336,25 +419,8 @@ class AppealGenerator:
 
     def _get_property_details(self, property_id: str) -> Dict[str, Any]:
         """Get extended property details from database."""
-        # Note: sq_ft and yr_built columns don't exist in the properties table yet
-        # When those columns are added, they can be included in this query
-        query = text("""
-            SELECT
-                id,
-                parcel_id,
-                ph_add AS address,
-                ow_name AS owner_name,
-                ow_add AS owner_address,
-                total_val_cents,
-                assess_val_cents,
-                prop_class
-            FROM properties
-            WHERE parcel_id = :property_id OR id::text = :property_id
-            LIMIT 1
-        """)
-
         with self._get_connection() as conn:
-            result = conn.execute(query, {"property_id": property_id})
+            result = conn.execute(_GET_PROPERTY_DETAILS_SQL, {"property_id": property_id})
             row = result.mappings().first()
 
         if not row:
@@ -392,9 +458,7 @@ class AppealGenerator:
             return summaries
 
         except Exception as e:
-            logger.error(f"Could not get comparables for {property_id}: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Could not get comparables for {property_id}: {e}")
             return []
 
     def _generate_letter(
@@ -404,12 +468,11 @@ class AppealGenerator:
         config: GeneratorConfig
     ) -> str:
         """Generate the appeal letter based on style."""
-        style = TemplateStyle(config.template_style)
         today = date.today()
 
         # Format values with safety checks
         assess_val = analysis.assess_val_cents if analysis.assess_val_cents else 0
-        current_val = f"${assess_val / 100:,.2f}"
+        current_val = _format_dollars(assess_val)
 
         # Calculate fair assessed value: median comparable market value * 0.20
         median_market_cents = analysis.median_comparable_value_cents
@@ -418,24 +481,35 @@ class AppealGenerator:
             median_market_cents = analysis.total_val_cents if analysis.total_val_cents else assess_val * 5
 
         requested_cents = int(median_market_cents * 0.20) if median_market_cents else assess_val
-        requested_val = f"${requested_cents / 100:,.2f}"
+        requested_val = _format_dollars(requested_cents)
 
         savings_cents = analysis.estimated_annual_savings_cents if analysis.estimated_annual_savings_cents else 0
-        savings = f"${savings_cents / 100:,.2f}"
+        savings = _format_dollars(savings_cents)
         owner_name = property_data.get('owner_name') or '[Property Owner]'
 
-        if style == TemplateStyle.CONCISE:
-            return self._generate_concise_letter(
-                analysis, today, current_val, requested_val, savings, owner_name, config
-            )
-        elif style == TemplateStyle.DETAILED:
-            return self._generate_detailed_letter(
-                analysis, today, current_val, requested_val, savings, owner_name, config
-            )
-        else:  # FORMAL (default)
-            return self._generate_formal_letter(
-                analysis, today, current_val, requested_val, savings, owner_name, config
-            )
+        build_letter = self._letter_builders[config.template_style]
+        return build_letter(
+            analysis, today, current_val, requested_val, savings, owner_name, config
+        )
+
+    @staticmethod
+    def _compare_market_values(analysis: AssessmentAnalysis) -> Tuple[float, float, float, float]:
+        """
+        Compare the subject's market value to the comparable median for letter text.
+
+        Returns:
+            (subject_market_value, median_comparable_value, value_difference, value_diff_pct)
+            in dollars; the median falls back to the subject value (or 1) to avoid
+            division by zero.
+        """
+        subject_market_value = analysis.total_val_cents / 100 if analysis.total_val_cents else 0
+        median_cents = analysis.median_comparable_value_cents
+        median_comparable_value = median_cents / 100 if median_cents and median_cents > 0 else subject_market_value
+        if median_comparable_value == 0:
+            median_comparable_value = subject_market_value if subject_market_value > 0 else 1
+        value_difference = subject_market_value - median_comparable_value
+        value_diff_pct = (value_difference / median_comparable_value * 100) if median_comparable_value > 0 else 0
+        return subject_market_value, median_comparable_value, value_difference, value_diff_pct
 
     def _generate_formal_letter(
         self,
@@ -448,13 +522,9 @@ class AppealGenerator:
         config: GeneratorConfig
     ) -> str:
         """Generate formal style appeal letter."""
-        # Calculate value difference for the letter
-        subject_market_value = analysis.total_val_cents / 100 if analysis.total_val_cents else 0
-        median_comparable_value = analysis.median_comparable_value_cents / 100 if analysis.median_comparable_value_cents and analysis.median_comparable_value_cents > 0 else subject_market_value
-        if median_comparable_value == 0:
-            median_comparable_value = subject_market_value if subject_market_value > 0 else 1  # Avoid division by zero
-        value_difference = subject_market_value - median_comparable_value
-        value_diff_pct = (value_difference / median_comparable_value * 100) if median_comparable_value > 0 else 0
+        subject_market_value, median_comparable_value, value_difference, value_diff_pct = (
+            self._compare_market_values(analysis)
+        )
 
         return f"""{today.strftime('%B %d, %Y')}
 
@@ -503,15 +573,11 @@ Respectfully,
         config: GeneratorConfig
     ) -> str:
         """Generate detailed style appeal letter."""
-        five_year_savings = f"${(analysis.estimated_five_year_savings_cents or 0) / 100:,.2f}"
+        five_year_savings = _format_dollars(analysis.estimated_five_year_savings_cents or 0)
 
-        # Calculate value comparisons with safety checks
-        subject_market_value = analysis.total_val_cents / 100 if analysis.total_val_cents else 0
-        median_comparable_value = analysis.median_comparable_value_cents / 100 if analysis.median_comparable_value_cents and analysis.median_comparable_value_cents > 0 else subject_market_value
-        if median_comparable_value == 0:
-            median_comparable_value = subject_market_value if subject_market_value > 0 else 1
-        value_difference = subject_market_value - median_comparable_value
-        value_diff_pct = (value_difference / median_comparable_value * 100) if median_comparable_value > 0 else 0
+        subject_market_value, median_comparable_value, value_difference, value_diff_pct = (
+            self._compare_market_values(analysis)
+        )
 
         return f"""{today.strftime('%B %d, %Y')}
 
@@ -605,12 +671,9 @@ Enclosures: Comparable Property Analysis, Evidence Summary"""
         config: GeneratorConfig
     ) -> str:
         """Generate concise style appeal letter."""
-        # Calculate value comparisons with safety checks
-        subject_market_value = analysis.total_val_cents / 100 if analysis.total_val_cents else 0
-        median_comparable_value = analysis.median_comparable_value_cents / 100 if analysis.median_comparable_value_cents and analysis.median_comparable_value_cents > 0 else subject_market_value
-        if median_comparable_value == 0:
-            median_comparable_value = subject_market_value if subject_market_value > 0 else 1
-        value_diff_pct = ((subject_market_value - median_comparable_value) / median_comparable_value * 100) if median_comparable_value > 0 else 0
+        subject_market_value, median_comparable_value, value_difference, value_diff_pct = (
+            self._compare_market_values(analysis)
+        )
 
         return f"""{today.strftime('%B %d, %Y')}
 
@@ -707,9 +770,9 @@ Statute:      Arkansas Code § 26-27-301"""
             f"Analysis based on {len(comparables)} comparable properties in Benton County",
             f"Fairness score of {analysis.fairness_score}/100 indicates {analysis.interpretation.lower().replace('_', '-')} (lower score = more over-assessed)",
             f"Statistical confidence level: {analysis.confidence}%",
-            f"Estimated over-assessment: ${over_assessment_cents / 100:,.2f}",
-            f"Projected annual tax savings if corrected: ${analysis.estimated_annual_savings_cents / 100:,.2f}",
-            f"Projected 5-year tax savings: ${analysis.estimated_five_year_savings_cents / 100:,.2f}",
+            f"Estimated over-assessment: {_format_dollars(over_assessment_cents)}",
+            f"Projected annual tax savings if corrected: {_format_dollars(analysis.estimated_annual_savings_cents)}",
+            f"Projected 5-year tax savings: {_format_dollars(analysis.estimated_five_year_savings_cents)}",
         ]
 
         if comparables:
@@ -772,35 +835,9 @@ Statute:      Arkansas Code § 26-27-301"""
         """Save appeal to database."""
         logger.info(f"Saving appeal {package.appeal_id} to database")
 
-        query = text("""
-            INSERT INTO tax_appeals (
-                id,
-                property_id,
-                status,
-                original_assessed_value_cents,
-                requested_value_cents,
-                reduction_amount_cents,
-                appeal_letter_text,
-                success_probability,
-                created_at,
-                updated_at
-            ) VALUES (
-                :id,
-                CAST(:property_id AS uuid),
-                :status,
-                :original_value,
-                :requested_value,
-                :reduction_amount,
-                :appeal_letter,
-                :success_probability,
-                CURRENT_TIMESTAMP,
-                CURRENT_TIMESTAMP
-            )
-        """)
-
         try:
             with self._get_connection() as conn:
-                conn.execute(query, {
+                conn.execute(_SAVE_APPEAL_SQL, {
                     'id': package.appeal_id,
                     'property_id': package.property_id,
                     'status': package.status,
@@ -858,12 +895,11 @@ if __name__ == "__main__":
         # Get a random property that qualifies for appeal
         query = text("""
             SELECT parcel_id
-            FROM properties
+            FROM properties TABLESAMPLE SYSTEM (1)
             WHERE assess_val_cents > 0
                 AND total_val_cents > 0
                 AND parcel_id IS NOT NULL
                 AND is_active = true
-            ORDER BY RANDOM()
             LIMIT 1
         """)
 
@@ -892,17 +928,15 @@ if __name__ == "__main__":
             if package:
                 print(f"\nProperty: {package.address}")
                 print(f"Parcel ID: {package.parcel_id}")
-                print(f"Current Value: ${package.current_assessed_value_cents / 100:,.2f}")
-                print(f"Requested Value: ${package.requested_assessed_value_cents / 100:,.2f}")
-                print(f"Estimated Savings: ${package.estimated_annual_savings_cents / 100:,.2f}/year")
+                print(f"Current Value: {_format_dollars(package.current_assessed_value_cents)}")
+                print(f"Requested Value: {_format_dollars(package.requested_assessed_value_cents)}")
+                print(f"Estimated Savings: {_format_dollars(package.estimated_annual_savings_cents)}/year")
                 print(f"Fairness Score: {package.fairness_score}/100")
                 print(f"Word Count: {package.word_count}")
                 print()
                 print("APPEAL LETTER:")
                 print("-" * 60)
-                print(package.appeal_letter_text[:2000])
-                if len(package.appeal_letter_text) > 2000:
-                    print("\n... [truncated]")
+                print(package.preview(2000))
             else:
                 print(f"Property {property_id} does not qualify for appeal")
 
@@ -4,13 +4,44 @@ Appeal Generation Data Models
 This module contains dataclasses and configuration models for the appeal generation system.
 """
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime, date
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any
 from enum import Enum
+from pathlib import Path
 import uuid
 
 
+# Timestamp shared by every package generated within the active batch run.
+# Packages created outside of a batch fall back to the current time.
+_batch_generated_at: ContextVar[Optional[datetime]] = ContextVar("batch_generated_at", default=None)
+
+
+def _generated_at_now() -> datetime:
+    """Return the active batch timestamp, or the current time outside a batch."""
+    return _batch_generated_at.get() or datetime.now()
+
+
+@contextmanager
+def batch_timestamp(generated_at: datetime) -> Iterator[datetime]:
+    """
+    Share a single generation timestamp across all packages created in this context.
+
+    Args:
+        generated_at: Timestamp to stamp on every AppealPackage built in the block
+
+    Yields:
+        The shared timestamp
+    """
+    token = _batch_generated_at.set(generated_at)
+    try:
+        yield generated_at
+    finally:
+        _batch_generated_at.reset(token)
+
+
 class AppealStatus(str, Enum):
     """Status of an appeal through its lifecycle."""
     DRAFT = "DRAFT"
@@ -50,7 +81,7 @@ class GeneratorConfig:
         filing_deadline_month: Month when appeals are due (default: 5 for May)
         filing_deadline_day: Day when appeals are due (default: 31)
     """
-    template_style: str = "formal"
+    template_style: TemplateStyle = TemplateStyle.FORMAL
     mill_rate: float = 65.0
     save_to_database: bool = False
     include_comparables: bool = True
@@ -59,6 +90,10 @@ class GeneratorConfig:
     filing_deadline_month: int = 5
     filing_deadline_day: int = 31
 
+    def __post_init__(self):
+        """Validate template_style once so generation can dispatch on the enum."""
+        self.template_style = TemplateStyle(self.template_style)
+
     def get_filing_deadline(self) -> date:
         """Calculate the next filing deadline."""
         today = date.today()
@@ -144,7 +179,7 @@ class AppealPackage:
     statute_reference: str = "Arkansas Code § 26-27-301"
 
     # Metadata
-    generated_at: datetime = field(default_factory=datetime.now)
+    generated_at: datetime = field(default_factory=_generated_at_now)
     generator_type: str = "TEMPLATE"
     template_style: str = "formal"
     model_version: str = "1.0.0"
@@ -173,6 +208,13 @@ class AppealPackage:
     def word_count(self) -> int:
         return len(self.appeal_letter_text.split()) if self.appeal_letter_text else 0
 
+    def preview(self, max_chars: int = 2000) -> str:
+        """Return the letter text, truncated to max_chars with a marker if longer."""
+        text = self.appeal_letter_text
+        if len(text) <= max_chars:
+            return text
+        return text[:max_chars] + "\n\n... [truncated]"
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -213,6 +255,8 @@ class BatchAppealResult:
     total_potential_savings_cents: int = 0
     appeals: List[AppealPackage] = field(default_factory=list)
     error_details: List[Dict[str, str]] = field(default_factory=list)
+    generated_at: datetime = field(default_factory=datetime.now)
+    output_path: Optional[Path] = None  # JSONL file appeals were streamed to, if any
 
     @property
     def total_potential_savings_dollars(self) -> float:
@@ -24,153 +24,165 @@ Usage:
     candidates = analyzer.find_appeal_candidates(min_score=60, limit=50)
 """
 
+import heapq
 import logging
-from dataclasses import dataclass, asdict
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
 from datetime import datetime
-from typing import List, Optional, Dict, Any
-from decimal import Decimal
+from functools import partial
+from operator import attrgetter
+from typing import List, NamedTuple, Optional, Dict, Any, Tuple
 
-from sqlalchemy import text
+import numpy as np
+import orjson
+from sqlalchemy import Uuid, bindparam, text
 from sqlalchemy.engine import Engine, Connection
 from sqlalchemy.exc import SQLAlchemyError
 
 from .comparable_service import ComparableService, PropertyNotFoundError, DatabaseError
 from .fairness_scorer import FairnessScorer, FairnessResult
 from .savings_estimator import SavingsEstimator, SavingsEstimate
+from .assessment_models import AssessmentAnalysis
 
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Number of comparables each property is scored against
+_COMPARABLE_LIMIT = 20
+
+# Parcels analyzed per requested appeal candidate in find_appeal_candidates;
+# many analyzed parcels fall below min_score or cannot be scored
+_CANDIDATE_OVERFETCH = 10
+
 
 # ============================================================================
-# DATA MODELS
+# SQL STATEMENTS
 # ============================================================================
+# Built once at import time and reused for every call.
+
+# Properties with valid assessment data, highest value first. No subdivision
+# screen: min_score keeps the fairer properties, which a filter on value above
+# the subdivision median would exclude.
+_FIND_CANDIDATES_SQL = text("""
+    SELECT parcel_id
+    FROM properties
+    WHERE assess_val_cents > 0
+        AND total_val_cents > 0
+        AND parcel_id IS NOT NULL
+        AND is_active = true
+    ORDER BY total_val_cents DESC
+    LIMIT :query_limit
+""")
+
+_SAVE_ANALYSIS_SQL = text("""
+    INSERT INTO assessment_analyses (
+        property_id,
+        analysis_date,
+        fairness_score,
+        assessment_ratio,
+        comparable_count,
+        recommended_action,
+        estimated_savings_cents,
+        confidence_level,
+        analysis_methodology,
+        ml_model_version,
+        analysis_parameters,
+        created_at
+    )
+    VALUES (
+        :property_id,
+        :analysis_date,
+        :fairness_score,
+        :assessment_ratio,
+        :comparable_count,
+        CAST(:recommended_action AS recommendation_action_enum),
+        :estimated_savings_cents,
+        :confidence_level,
+        CAST('STATISTICAL' AS analysis_methodology_enum),
+        :ml_model_version,
+        CAST(:analysis_parameters AS jsonb),
+        CURRENT_TIMESTAMP
+    )
+""").bindparams(bindparam("property_id", type_=Uuid))  # uuid.UUID via the driver's native UUID adapter
+
+_GET_PROPERTY_SQL = text("""
+    SELECT
+        id,
+        parcel_id,
+        ph_add AS address,
+        total_val_cents,
+        assess_val_cents,
+        acre_area,
+        ow_name AS owner_name
+    FROM properties
+    WHERE parcel_id = :parcel_id
+        AND is_active = true
+    LIMIT 1
+""")
+
+_GET_PROPERTIES_BULK_SQL = text("""
+    SELECT
+        id,
+        parcel_id,
+        ph_add AS address,
+        total_val_cents,
+        assess_val_cents,
+        acre_area,
+        ow_name AS owner_name
+    FROM properties
+    WHERE parcel_id = ANY(:parcel_ids)
+        AND is_active = true
+""")
 
-@dataclass
-class AssessmentAnalysis:
-    """
-    Complete assessment analysis result for a property using SALES COMPARISON APPROACH.
-
-    This dataclass combines results from all services into a single comprehensive
-    report suitable for display to users or storage in database.
-
-    SCORING (from taxpayer perspective):
-    - Higher fairness_score = fairer assessment (less likely over-assessed)
-    - Lower fairness_score = more likely over-assessed (better appeal candidate)
-    - 90-100: Fairly assessed (at or below comparable median)
-    - 70-89: Slightly above comparables (probably fair)
-    - 50-69: Moderately above comparables (worth reviewing)
-    - 30-49: Significantly above comparables (appeal candidate)
-    - 0-29: Greatly above comparables (strong appeal candidate)
-    """
-    # Property identification
-    property_id: str
-    parcel_id: Optional[str]
-    address: str
 
-    # Current values (all in cents)
+# ============================================================================
+# PROPERTY RECORDS
+# ============================================================================
+
+class _PropertyRecord(NamedTuple):
+    """Subject property fields read by the analysis pipeline (values in cents)."""
+    id: str
+    parcel_id: str
+    address: Optional[str]
     total_val_cents: int
     assess_val_cents: int
-    current_ratio: float  # assess_val / total_val (always ~20% for Benton County)
-
-    # Analysis results from FairnessScorer (SALES COMPARISON APPROACH)
-    fairness_score: int  # 0-100 (higher = FAIRER, lower = appeal candidate)
-    confidence: int  # 0-100 (confidence in the analysis)
-    interpretation: str  # "FAIR", "POTENTIALLY_OVER_ASSESSED", "OVER_ASSESSED"
-
-    # Comparables summary from ComparableService
-    comparable_count: int
-    median_comparable_value_cents: int  # Median total market value of comparables (in cents)
-
-    # Savings estimate from SavingsEstimator
-    estimated_annual_savings_cents: int
-    estimated_five_year_savings_cents: int
+    acreage: float
+    owner_name: Optional[str]
 
-    # Recommendation logic
-    recommended_action: str  # "APPEAL", "MONITOR", "NONE"
 
-    # Metadata
-    analysis_date: datetime
+# ============================================================================
+# RECOMMENDATION RULES
+# ============================================================================
 
-    # Fields with default values must come last
-    appeal_strength: Optional[str] = None  # "STRONG", "MODERATE", "WEAK" (None if no appeal)
-    comparables: List[Any] = None  # List of ComparableProperty objects
-    model_version: str = "1.0.0"
+# (recommended_action, appeal_strength) indexed by _recommendation_code
+_RECOMMENDATIONS: Tuple[Tuple[str, Optional[str]], ...] = (
+    ("NONE", None),
+    ("MONITOR", "WEAK"),
+    ("APPEAL", "MODERATE"),
+    ("APPEAL", "STRONG"),
+)
 
-    # Backward compatibility property
-    @property
-    def median_comparable_ratio(self) -> float:
-        """Backward compatibility - returns median_comparable_value_cents."""
-        return float(self.median_comparable_value_cents)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization or database storage."""
-        return {
-            'property_id': self.property_id,
-            'parcel_id': self.parcel_id,
-            'address': self.address,
-            'total_val_cents': self.total_val_cents,
-            'assess_val_cents': self.assess_val_cents,
-            'current_ratio': round(self.current_ratio, 4),
-            'fairness_score': self.fairness_score,
-            'confidence': self.confidence,
-            'interpretation': self.interpretation,
-            'comparable_count': self.comparable_count,
-            'median_comparable_value_cents': self.median_comparable_value_cents,
-            'estimated_annual_savings_cents': self.estimated_annual_savings_cents,
-            'estimated_five_year_savings_cents': self.estimated_five_year_savings_cents,
-            'recommended_action': self.recommended_action,
-            'appeal_strength': self.appeal_strength,
-            'analysis_date': self.analysis_date.isoformat(),
-            'model_version': self.model_version
-        }
+def _recommendation_code(fairness_score: int, over_assessment_cents: int, savings_cents: int) -> int:
+    """
+    Classify a property into a _RECOMMENDATIONS index (0=NONE .. 3=STRONG).
 
-    @property
-    def total_val_dollars(self) -> float:
-        """Total market value in dollars."""
-        return self.total_val_cents / 100.0
-
-    @property
-    def assess_val_dollars(self) -> float:
-        """Assessed value in dollars."""
-        return self.assess_val_cents / 100.0
-
-    @property
-    def estimated_annual_savings_dollars(self) -> float:
-        """Estimated annual savings in dollars."""
-        return self.estimated_annual_savings_cents / 100.0
-
-    @property
-    def estimated_five_year_savings_dollars(self) -> float:
-        """Estimated 5-year savings in dollars."""
-        return self.estimated_five_year_savings_cents / 100.0
-
-    def __str__(self) -> str:
-        """Human-readable string representation."""
-        return (
-            f"Assessment Analysis for {self.address}\n"
-            f"{'=' * 70}\n"
-            f"Property ID: {self.property_id} (Parcel: {self.parcel_id})\n"
-            f"Total Value: ${self.total_val_dollars:,.2f}\n"
-            f"Assessed Value: ${self.assess_val_dollars:,.2f} ({self.current_ratio:.2%})\n"
-            f"\n"
-            f"Fairness Analysis:\n"
-            f"  Score: {self.fairness_score}/100 ({self.interpretation})\n"
-            f"  Confidence: {self.confidence}/100\n"
-            f"  Comparables: {self.comparable_count} properties\n"
-            f"  Median Comparable Value: ${self.median_comparable_value_cents / 100:,.2f}\n"
-            f"\n"
-            f"Potential Savings:\n"
-            f"  Annual: ${self.estimated_annual_savings_dollars:,.2f}\n"
-            f"  5-Year: ${self.estimated_five_year_savings_dollars:,.2f}\n"
-            f"\n"
-            f"Recommendation: {self.recommended_action}"
-            + (f" ({self.appeal_strength} case)" if self.appeal_strength else "") +
-            f"\n"
-            f"Analysis Date: {self.analysis_date.strftime('%Y-%m-%d %H:%M:%S')}\n"
-            f"{'=' * 70}"
-        )
+    Kept as a pure function of plain ints so it can be vectorized or compiled
+    for batch scoring without touching the analyzer.
+    """
+    # Strong appeal case - significantly over-assessed ($10k over, $100+ savings)
+    if fairness_score <= 40 and over_assessment_cents >= 1000000 and savings_cents >= 10000:
+        return 3
+    # Moderate appeal case ($5k over, $50+ savings)
+    if fairness_score <= 60 and over_assessment_cents >= 500000 and savings_cents >= 5000:
+        return 2
+    # Monitor case - slightly above comparables
+    if fairness_score <= 75 and over_assessment_cents > 0:
+        return 1
+    # No action needed - property is at or below comparable median
+    return 0
 
 
 # ============================================================================
@@ -211,15 +223,25 @@ class AssessmentAnalyzer:
         """
         self.db = db_connection
         self.default_mill_rate = default_mill_rate
+        # Reusable no-op context manager when given a Connection; Engines connect per call
+        self._conn_ctx = None if isinstance(db_connection, Engine) else nullcontext(db_connection)
 
         # Initialize sub-services
         self.comparable_service = ComparableService(db_connection)
         self.fairness_scorer = FairnessScorer()
         self.savings_estimator = SavingsEstimator(default_mill_rate=default_mill_rate)
 
+        # Sub-service methods called once per property, bound once here
+        self._find_comparables = self.comparable_service.find_comparables
+        self._calc_fairness = self.fairness_scorer.calculate_fairness_score
+
         logger.info(f"AssessmentAnalyzer initialized with mill_rate={default_mill_rate}")
 
-    def analyze_property(self, property_id: str) -> Optional[AssessmentAnalysis]:
+    def analyze_property(
+        self,
+        property_id: str,
+        analysis_date: Optional[datetime] = None
+    ) -> Optional[AssessmentAnalysis]:
         """
         Perform complete assessment analysis using the SALES COMPARISON APPROACH.
 
@@ -235,6 +257,7 @@ class AssessmentAnalyzer:
 
         Args:
             property_id: Parcel ID to analyze
+            analysis_date: Timestamp to record on the analysis (default: now)
 
         Returns:
             AssessmentAnalysis with complete results, or None if property cannot be analyzed
@@ -243,7 +266,7 @@ class AssessmentAnalyzer:
             PropertyNotFoundError: If property doesn't exist
             DatabaseError: If database operation fails
         """
-        logger.info(f"Starting sales comparison analysis for property: {property_id}")
+        logger.info("Starting sales comparison analysis for property: %s", property_id)
 
         try:
             # Step 1: Get property details
@@ -251,82 +274,170 @@ class AssessmentAnalyzer:
             if not property_data:
                 raise PropertyNotFoundError(property_id)
 
-            # Validate property has required data
-            if property_data['assess_val_cents'] <= 0 or property_data['total_val_cents'] <= 0:
-                logger.warning(
-                    f"Property {property_id} has invalid valuation data "
-                    f"(assess={property_data['assess_val_cents']}, total={property_data['total_val_cents']}). "
-                    "Cannot analyze."
-                )
-                return None
-
-            # Calculate current assessment ratio (for display - always ~20%)
-            current_ratio = property_data['assess_val_cents'] / property_data['total_val_cents']
-
-            # Step 2: Find truly comparable properties using sales comparison approach
-            # The comparable finder now prioritizes same subdivision and similar characteristics
-            logger.debug(f"Finding comparable properties for {property_id}")
-            comparables = self.comparable_service.find_comparables(property_id, limit=20)
-
-            if not comparables or len(comparables) == 0:
-                logger.warning(f"No comparables found for property {property_id}. Cannot perform fairness analysis.")
-                return None
-
-            # Step 3: Calculate fairness score using TOTAL VALUE comparison
-            # Compare subject's total_val_cents to comparable total_val_cents
-            # Higher value than comparables = potentially over-assessed
-            logger.debug(f"Calculating fairness score for {property_id}")
-
-            subject_total_value = property_data['total_val_cents']
-            comparable_values = [comp.total_val_cents for comp in comparables]
-
-            # Use the updated fairness scorer with value comparison
-            fairness_result = self.fairness_scorer.calculate_fairness_score(
-                subject_value=subject_total_value,
-                comparable_values=comparable_values
-            )
+            return self._analyze_from_data(property_id, property_data, analysis_date=analysis_date)
 
-            if not fairness_result:
-                logger.warning(f"Could not calculate fairness score for {property_id}")
-                return None
-
-            # Step 4: Get savings from fairness result (already calculated)
-            # The new FairnessScorer calculates over_assessment and potential_savings
-            estimated_annual_savings = fairness_result.potential_annual_savings_cents
-            estimated_five_year_savings = estimated_annual_savings * 5
-
-            # Step 5: Determine recommendation based on new score interpretation
-            # Note: New scoring is INVERTED - higher score = fairer
-            recommended_action, appeal_strength = self._determine_recommendation_v2(
-                fairness_score=fairness_result.fairness_score,
-                confidence=fairness_result.confidence,
-                over_assessment_cents=fairness_result.over_assessment_cents,
-                savings_cents=estimated_annual_savings
-            )
+        except PropertyNotFoundError:
+            raise
+        except SQLAlchemyError as e:
+            logger.error("Database error analyzing property %s: %s", property_id, e)
+            raise DatabaseError(f"Database operation failed: {str(e)}") from e
+        except Exception as e:
+            logger.error("Unexpected error analyzing property %s: %s", property_id, e)
+            raise
 
-            # Step 6: Build analysis result
-            # Store median_comparable_value_cents (market value of comparable properties)
-            analysis = AssessmentAnalysis(
-                property_id=property_data['id'],
-                parcel_id=property_data['parcel_id'],
-                address=property_data['address'] or "Address not available",
-                total_val_cents=property_data['total_val_cents'],
-                assess_val_cents=property_data['assess_val_cents'],
-                current_ratio=current_ratio,
-                fairness_score=fairness_result.fairness_score,
-                confidence=fairness_result.confidence,
-                interpretation=fairness_result.interpretation,
-                comparable_count=len(comparables),
-                median_comparable_value_cents=fairness_result.median_value,  # Median total value of comparables
-                comparables=comparables,
-                estimated_annual_savings_cents=estimated_annual_savings,
-                estimated_five_year_savings_cents=estimated_five_year_savings,
-                recommended_action=recommended_action,
-                appeal_strength=appeal_strength,
-                analysis_date=datetime.now(),
-                model_version="2.0.0"  # Updated version for sales comparison approach
+    def _analyze_from_data(
+        self,
+        property_id: str,
+        property_data: _PropertyRecord,
+        min_score: Optional[int] = None,
+        analysis_date: Optional[datetime] = None,
+        include_comparables: bool = True
+    ) -> Optional[AssessmentAnalysis]:
+        """
+        Run the sales comparison analysis for already-fetched property data.
+
+        Shared by analyze_property (single lookup) and analyze_batch (bulk lookup).
+
+        Args:
+            property_id: Parcel ID being analyzed
+            property_data: Property record as returned by _get_property_data
+            min_score: If set, results scoring below this are dropped before the
+                AssessmentAnalysis is built
+            analysis_date: Timestamp to record on the analysis (default: now)
+            include_comparables: Whether to attach the comparables list to the result
+
+        Returns:
+            AssessmentAnalysis with complete results, or None if property cannot be
+            analyzed or falls below min_score
+        """
+        core = self._compute_analysis_core(property_id, property_data, min_score)
+        if core is None:
+            return None
+
+        return self._build_analysis(
+            property_id, property_data, *core,
+            analysis_date=analysis_date, include_comparables=include_comparables
+        )
+
+    def _compute_analysis_core(
+        self,
+        property_id: str,
+        property_data: _PropertyRecord,
+        min_score: Optional[int] = None
+    ) -> Optional[Tuple[List[Any], FairnessResult, int, str, Optional[str]]]:
+        """
+        Score a property against its comparables without building the result dataclass.
+
+        Args:
+            property_id: Parcel ID being analyzed
+            property_data: Property record as returned by _get_property_data
+            min_score: If set, properties scoring below this return None before the
+                recommendation is determined
+
+        Returns:
+            Tuple of (comparables, fairness_result, estimated_annual_savings_cents,
+            recommended_action, appeal_strength), or None if the property cannot
+            be analyzed or falls below min_score
+        """
+        # Validate property has required data
+        if property_data.assess_val_cents <= 0 or property_data.total_val_cents <= 0:
+            logger.warning(
+                "Property %s has invalid valuation data (assess=%s, total=%s). Cannot analyze.",
+                property_id, property_data.assess_val_cents, property_data.total_val_cents
             )
+            return None
+
+        # Step 2: Find truly comparable properties using sales comparison approach
+        # The comparable finder now prioritizes same subdivision and similar characteristics
+        logger.debug("Finding comparable properties for %s", property_id)
+        comparables = self._find_comparables(property_id, limit=_COMPARABLE_LIMIT)
+
+        if not comparables or len(comparables) == 0:
+            logger.warning("No comparables found for property %s. Cannot perform fairness analysis.", property_id)
+            return None
+
+        # Step 3: Calculate fairness score using TOTAL VALUE comparison
+        # Compare subject's total_val_cents to comparable total_val_cents
+        # Higher value than comparables = potentially over-assessed
+        logger.debug("Calculating fairness score for %s", property_id)
+
+        subject_total_value = property_data.total_val_cents
+        comparable_values = np.fromiter(
+            (comp.total_val_cents for comp in comparables),
+            dtype=np.int64,
+            count=len(comparables)
+        )
+
+        # Use the updated fairness scorer with value comparison
+        fairness_result = self._calc_fairness(
+            subject_value=subject_total_value,
+            comparable_values=comparable_values
+        )
+
+        if not fairness_result:
+            logger.warning("Could not calculate fairness score for %s", property_id)
+            return None
 
+        if min_score is not None and fairness_result.fairness_score < min_score:
+            logger.debug("Property %s scored below %s; skipping", property_id, min_score)
+            return None
+
+        # Step 4: Get savings from fairness result (already calculated)
+        # The new FairnessScorer calculates over_assessment and potential_savings
+        estimated_annual_savings = fairness_result.potential_annual_savings_cents
+
+        # Step 5: Determine recommendation based on new score interpretation
+        # Note: New scoring is INVERTED - higher score = fairer
+        recommended_action, appeal_strength = self._determine_recommendation_v2(
+            fairness_score=fairness_result.fairness_score,
+            confidence=fairness_result.confidence,
+            over_assessment_cents=fairness_result.over_assessment_cents,
+            savings_cents=estimated_annual_savings
+        )
+
+        return comparables, fairness_result, estimated_annual_savings, recommended_action, appeal_strength
+
+    def _build_analysis(
+        self,
+        property_id: str,
+        property_data: _PropertyRecord,
+        comparables: List[Any],
+        fairness_result: FairnessResult,
+        estimated_annual_savings: int,
+        recommended_action: str,
+        appeal_strength: Optional[str],
+        analysis_date: Optional[datetime] = None,
+        include_comparables: bool = True
+    ) -> AssessmentAnalysis:
+        """Build the AssessmentAnalysis for a result from _compute_analysis_core."""
+        # Calculate current assessment ratio (for display - always ~20%)
+        current_ratio = property_data.assess_val_cents / property_data.total_val_cents
+
+        # Step 6: Build analysis result
+        # Store median_comparable_value_cents (market value of comparable properties)
+        analysis = AssessmentAnalysis(
+            property_id=property_data.id,
+            parcel_id=property_data.parcel_id,
+            address=property_data.address or "Address not available",
+            total_val_cents=property_data.total_val_cents,
+            assess_val_cents=property_data.assess_val_cents,
+            current_ratio=current_ratio,
+            fairness_score=fairness_result.fairness_score,
+            confidence=fairness_result.confidence,
+            interpretation=fairness_result.interpretation,
+            comparable_count=len(comparables),
+            median_comparable_value_cents=fairness_result.median_value,  # Median total value of comparables
+            comparables=comparables if include_comparables else [],
+            estimated_annual_savings_cents=estimated_annual_savings,
+            estimated_five_year_savings_cents=estimated_annual_savings * 5,
+            recommended_action=recommended_action,
+            appeal_strength=appeal_strength,
+            analysis_date=analysis_date or datetime.now(),
+            model_version="2.0.0"  # Updated version for sales comparison approach
+        )
+
+        # Gated so the dollar formatting is skipped when INFO is off
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
                 f"Analysis complete for {property_id}: "
                 f"fairness={fairness_result.fairness_score}/100, "
@@ -336,79 +447,165 @@ class AssessmentAnalyzer:
                 f"potential_savings=${estimated_annual_savings / 100:,.2f}/year"
             )
 
-            return analysis
-
-        except PropertyNotFoundError:
-            raise
-        except SQLAlchemyError as e:
-            logger.error(f"Database error analyzing property {property_id}: {e}")
-            raise DatabaseError(f"Database operation failed: {str(e)}") from e
-        except Exception as e:
-            logger.error(f"Unexpected error analyzing property {property_id}: {e}")
-            raise
+        return analysis
 
     def analyze_batch(
         self,
         property_ids: List[str],
-        batch_size: int = 100
+        batch_size: int = 100,
+        max_workers: Optional[int] = None,
+        min_score: Optional[int] = None,
+        include_comparables: bool = False
     ) -> List[AssessmentAnalysis]:
         """
         Analyze multiple properties in batches.
 
         Processes properties in batches to manage memory efficiently and logs
-        progress for long-running operations.
+        progress for long-running operations. Property rows for each batch are
+        loaded with a single query rather than one query per parcel.
+
+        When the analyzer holds an Engine, the per-property analyses of a batch
+        run on a thread pool so their comparable queries overlap; each worker
+        checks out its own pooled connection. A single Connection is not
+        thread-safe, so it is always processed sequentially.
+
+        With an Engine, the next batch's property rows are also fetched on a
+        background thread while the current batch is being analyzed.
 
         Args:
             property_ids: List of property IDs to analyze
             batch_size: Number of properties to process at once (default: 100)
+            max_workers: Worker threads per batch (default: min(32, batch_size), capped
+                to leave one pooled connection free for the next-batch prefetch)
+            min_score: If set, analyzed properties scoring below this are dropped
+                without building their AssessmentAnalysis
+            include_comparables: Attach each result's comparables list (default: False).
+                Batch results only keep comparable_count and the median so large runs
+                don't hold every comparable in memory; use
+                AssessmentAnalysis.fetch_comparables to load them for a single result.
 
         Returns:
             List of AssessmentAnalysis results, sorted by fairness_score descending.
             Properties that cannot be analyzed are omitted from results.
         """
-        logger.info(f"Starting batch analysis of {len(property_ids)} properties (batch_size={batch_size})")
+        logger.info("Starting batch analysis of %d properties (batch_size=%d)", len(property_ids), batch_size)
 
         results = []
         total_analyzed = 0
         total_errors = 0
+        # Analyses in one batch run share a single timestamp
+        analysis_date = datetime.now()
+
+        workers = max_workers or self._default_workers(batch_size)
+        executor = (
+            ThreadPoolExecutor(max_workers=workers)
+            if isinstance(self.db, Engine) and workers > 1
+            else None
+        )
+        # One-deep prefetch queue: load the next batch's rows while this one is analyzed
+        prefetch = ThreadPoolExecutor(max_workers=1) if isinstance(self.db, Engine) else None
+        next_fetch = (
+            prefetch.submit(self._get_properties_bulk, property_ids[:batch_size])
+            if prefetch and property_ids
+            else None
+        )
+
+        try:
+            # Process in batches
+            for i in range(0, len(property_ids), batch_size):
+                batch = property_ids[i:i + batch_size]
+                batch_num = (i // batch_size) + 1
+                total_batches = (len(property_ids) + batch_size - 1) // batch_size
 
-        # Process in batches
-        for i in range(0, len(property_ids), batch_size):
-            batch = property_ids[i:i + batch_size]
-            batch_num = (i // batch_size) + 1
-            total_batches = (len(property_ids) + batch_size - 1) // batch_size
+                logger.info("Processing batch %d/%d (%d properties)", batch_num, total_batches, len(batch))
 
-            logger.info(f"Processing batch {batch_num}/{total_batches} ({len(batch)} properties)")
+                fetch = next_fetch
+                if prefetch and i + batch_size < len(property_ids):
+                    next_fetch = prefetch.submit(
+                        self._get_properties_bulk, property_ids[i + batch_size:i + 2 * batch_size]
+                    )
 
-            for prop_id in batch:
+                # Fetch every property in the batch with one query instead of one per parcel
                 try:
-                    analysis = self.analyze_property(prop_id)
-                    if analysis:
-                        results.append(analysis)
-                        total_analyzed += 1
+                    batch_data = fetch.result() if fetch else self._get_properties_bulk(batch)
+                except Exception as e:
+                    total_errors += len(batch)
+                    logger.error("Error loading property data for batch %d: %s", batch_num, e)
+                    continue
+
+                pending = []
+                for prop_id in batch:
+                    property_data = batch_data.get(prop_id)
+                    if not property_data:
+                        total_errors += 1
+                        logger.warning("Property %s not found", prop_id)
                     else:
+                        pending.append((prop_id, property_data))
+
+                # Load comparables for the whole batch in one query; the
+                # per-property analyses then read them from the cache
+                if pending:
+                    try:
+                        self._prefetch_comparables([prop_id for prop_id, _ in pending], _COMPARABLE_LIMIT)
+                    except Exception as e:
+                        logger.warning(
+                            "Bulk comparables lookup failed for batch %d, "
+                            "falling back to per-property queries: %s", batch_num, e
+                        )
+
+                if executor:
+                    futures = {
+                        executor.submit(
+                            self._analyze_from_data,
+                            prop_id, property_data, min_score, analysis_date, include_comparables
+                        ): prop_id
+                        for prop_id, property_data in pending
+                    }
+                    outcomes = ((futures[future], future.result) for future in as_completed(futures))
+                else:
+                    outcomes = (
+                        (prop_id, partial(
+                            self._analyze_from_data,
+                            prop_id, property_data, min_score, analysis_date, include_comparables
+                        ))
+                        for prop_id, property_data in pending
+                    )
+
+                for prop_id, get_analysis in outcomes:
+                    try:
+                        analysis = get_analysis()
+                        if analysis:
+                            results.append(analysis)
+                            total_analyzed += 1
+                        else:
+                            total_errors += 1
+                            logger.debug("Property %s skipped (insufficient data or below min_score)", prop_id)
+                    except PropertyNotFoundError:
                         total_errors += 1
-                        logger.debug(f"Property {prop_id} could not be analyzed (insufficient data)")
-                except PropertyNotFoundError:
-                    total_errors += 1
-                    logger.warning(f"Property {prop_id} not found")
-                except Exception as e:
-                    total_errors += 1
-                    logger.error(f"Error analyzing property {prop_id}: {e}")
-
-            # Log progress every 1000 properties
-            if (i + batch_size) % 1000 == 0 or (i + batch_size) >= len(property_ids):
-                logger.info(
-                    f"Progress: {min(i + batch_size, len(property_ids))}/{len(property_ids)} "
-                    f"({total_analyzed} analyzed, {total_errors} errors)"
-                )
+                        logger.warning("Property %s not found", prop_id)
+                    except Exception as e:
+                        total_errors += 1
+                        logger.error("Error analyzing property %s: %s", prop_id, e)
+
+                # Log progress every 1000 properties
+                if (i + batch_size) % 1000 == 0 or (i + batch_size) >= len(property_ids):
+                    logger.info(
+                        "Progress: %d/%d (%d analyzed, %d errors)",
+                        min(i + batch_size, len(property_ids)), len(property_ids),
+                        total_analyzed, total_errors
+                    )
+        finally:
+            if executor:
+                executor.shutdown()
+            if prefetch:
+                prefetch.shutdown(cancel_futures=True)
 
         # Sort by fairness score descending (most over-assessed first)
-        results.sort(key=lambda x: x.fairness_score, reverse=True)
+        results.sort(key=attrgetter("fairness_score"), reverse=True)
 
         logger.info(
-            f"Batch analysis complete: {total_analyzed} properties analyzed, "
-            f"{total_errors} errors/skipped"
+            "Batch analysis complete: %d properties analyzed, %d errors/skipped",
+            total_analyzed, total_errors
         )
 
         return results
@@ -428,7 +625,8 @@ class AssessmentAnalyzer:
         4. Returns top candidates sorted by estimated savings
 
         Args:
-            min_score: Minimum fairness score to include (default: 60)
+            min_score: Minimum fairness score to include; results with
+                fairness_score >= min_score are kept (default: 60)
             limit: Maximum number of candidates to return (default: 100)
 
         Returns:
@@ -438,48 +636,27 @@ class AssessmentAnalyzer:
         logger.info(f"Finding appeal candidates (min_score={min_score}, limit={limit})")
 
         try:
-            # Query properties with valid assessment data
-            # Focus on properties that are actually assessed (assess_val_cents > 0)
-            query = text("""
-                SELECT parcel_id
-                FROM properties
-                WHERE assess_val_cents > 0
-                    AND total_val_cents > 0
-                    AND parcel_id IS NOT NULL
-                    AND is_active = true
-                ORDER BY total_val_cents DESC
-                LIMIT :query_limit
-            """)
-
             # Query more properties than limit to account for filtering
-            query_limit = min(limit * 10, 10000)  # Cap at 10k to avoid excessive queries
+            query_limit = min(limit * _CANDIDATE_OVERFETCH, 10000)  # Cap at 10k to avoid excessive queries
 
             with self._get_connection() as conn:
-                result = conn.execute(query, {"query_limit": query_limit})
-                property_ids = [row.parcel_id for row in result.fetchall()]
+                property_ids = conn.execute(
+                    _FIND_CANDIDATES_SQL, {"query_limit": query_limit}
+                ).scalars().all()
 
             logger.info(f"Found {len(property_ids)} properties to analyze")
 
-            # Analyze all properties
-            analyses = self.analyze_batch(property_ids)
-
-            # Filter by minimum score
-            candidates = [
-                analysis for analysis in analyses
-                if analysis.fairness_score >= min_score
-            ]
+            # Analyze all properties; results below min_score are dropped before
+            # their AssessmentAnalysis is built
+            candidates = self.analyze_batch(property_ids, min_score=min_score)
 
             logger.info(f"Found {len(candidates)} candidates with score >= {min_score}")
 
-            # Sort by estimated savings (highest first)
-            candidates.sort(
-                key=lambda x: x.estimated_annual_savings_cents,
-                reverse=True
+            # Top N by estimated savings (highest first), without sorting the rest
+            top_candidates = heapq.nlargest(
+                limit, candidates, key=attrgetter("estimated_annual_savings_cents")
             )
 
-            # Return top N
-            top_candidates = candidates[:limit]
-
             logger.info(
                 f"Returning top {len(top_candidates)} appeal candidates. "
                 f"Top savings: ${top_candidates[0].estimated_annual_savings_dollars:,.2f}/year "
@@ -495,6 +672,10 @@ class AssessmentAnalyzer:
             logger.error(f"Unexpected error finding appeal candidates: {e}")
             raise
 
+    def clear_caches(self) -> None:
+        """Drop cached comparable lookups held by ComparableService."""
+        self.comparable_service.invalidate()
+
     def save_analysis(self, analysis: AssessmentAnalysis) -> None:
         """
         Save analysis results to the assessment_analyses table.
@@ -508,85 +689,114 @@ class AssessmentAnalyzer:
         Raises:
             DatabaseError: If save operation fails
         """
-        logger.info(f"Saving analysis for property {analysis.property_id}")
+        logger.info("Saving analysis for property %s", analysis.property_id)
 
         try:
-            # Map our analysis to the database schema
-            # Note: Simply insert without conflict handling for now
-            query = text("""
-                INSERT INTO assessment_analyses (
-                    property_id,
-                    analysis_date,
-                    fairness_score,
-                    assessment_ratio,
-                    comparable_count,
-                    recommended_action,
-                    estimated_savings_cents,
-                    confidence_level,
-                    analysis_methodology,
-                    ml_model_version,
-                    analysis_parameters,
-                    created_at
-                )
-                VALUES (
-                    CAST(:property_id AS uuid),
-                    :analysis_date,
-                    :fairness_score,
-                    :assessment_ratio,
-                    :comparable_count,
-                    CAST(:recommended_action AS recommendation_action_enum),
-                    :estimated_savings_cents,
-                    :confidence_level,
-                    CAST('STATISTICAL' AS analysis_methodology_enum),
-                    :ml_model_version,
-                    CAST(:analysis_parameters AS jsonb),
-                    CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Prepare analysis parameters JSON
-            import json
-            analysis_parameters = json.dumps({
-                'parcel_id': analysis.parcel_id,
-                'address': analysis.address,
-                'total_val_cents': analysis.total_val_cents,
-                'assess_val_cents': analysis.assess_val_cents,
-                'current_ratio': analysis.current_ratio,
-                'median_comparable_value_cents': analysis.median_comparable_value_cents,
-                'interpretation': analysis.interpretation,
-                'appeal_strength': analysis.appeal_strength,
-                'estimated_five_year_savings_cents': analysis.estimated_five_year_savings_cents
-            })
-
-            with self._get_connection() as conn:
-                conn.execute(query, {
-                    'property_id': analysis.property_id,
-                    'analysis_date': analysis.analysis_date.date(),
-                    'fairness_score': analysis.fairness_score,
-                    'assessment_ratio': float(analysis.current_ratio),
-                    'comparable_count': analysis.comparable_count,
-                    'recommended_action': analysis.recommended_action,
-                    'estimated_savings_cents': analysis.estimated_annual_savings_cents,
-                    'confidence_level': analysis.confidence,
-                    'ml_model_version': analysis.model_version,
-                    'analysis_parameters': analysis_parameters
-                })
-                conn.commit()
-
-            logger.info(f"Successfully saved analysis for property {analysis.property_id}")
+            self._insert_analyses(self._build_analysis_params(analysis))
+            logger.info("Successfully saved analysis for property %s", analysis.property_id)
 
         except SQLAlchemyError as e:
-            logger.error(f"Database error saving analysis: {e}")
+            logger.error("Database error saving analysis: %s", e)
             raise DatabaseError(f"Failed to save analysis: {str(e)}") from e
         except Exception as e:
-            logger.error(f"Unexpected error saving analysis: {e}")
+            logger.error("Unexpected error saving analysis: %s", e)
             raise
 
+    def save_analyses(self, analyses: List[AssessmentAnalysis]) -> int:
+        """
+        Save several analyses to the assessment_analyses table.
+
+        Each analysis is validated first; one whose parameters cannot be built
+        (e.g. a malformed property_id) is logged and skipped. The rest are sent
+        with a single executemany INSERT and committed once. If that transaction
+        fails, every analysis is retried on its own with save_analysis, so one
+        bad row does not drop the batch.
+
+        Args:
+            analyses: AssessmentAnalysis results to save
+
+        Returns:
+            Number of analyses saved
+        """
+        if not analyses:
+            return 0
+
+        logger.info("Saving %d analyses", len(analyses))
+
+        valid = []
+        params = []
+        for analysis in analyses:
+            try:
+                params.append(self._build_analysis_params(analysis))
+                valid.append(analysis)
+            except (TypeError, ValueError, AttributeError) as e:
+                logger.warning("Skipping analysis for property %s: %s", analysis.property_id, e)
+
+        if not params:
+            return 0
+
+        try:
+            self._insert_analyses(params)
+        except SQLAlchemyError as e:
+            logger.warning("Batch save of %d analyses failed, saving individually: %s", len(params), e)
+            saved = 0
+            for analysis in valid:
+                try:
+                    self.save_analysis(analysis)
+                    saved += 1
+                except DatabaseError:
+                    pass  # Logged by save_analysis
+            return saved
+
+        logger.info("Successfully saved %d analyses", len(params))
+        return len(params)
+
     # ========================================================================
     # PRIVATE HELPER METHODS
     # ========================================================================
 
-    def _get_property_data(self, property_id: str) -> Optional[Dict[str, Any]]:
+    def _insert_analyses(self, params: Dict[str, Any] | List[Dict[str, Any]]) -> None:
+        """Run _SAVE_ANALYSIS_SQL for one or many parameter sets and commit."""
+        with self._get_connection() as conn:
+            try:
+                # Note: Simply insert without conflict handling for now
+                conn.execute(_SAVE_ANALYSIS_SQL, params)
+                conn.commit()
+            except SQLAlchemyError:
+                # Leave the connection usable for per-row retries
+                conn.rollback()
+                raise
+
+    @staticmethod
+    def _build_analysis_params(analysis: AssessmentAnalysis) -> Dict[str, Any]:
+        """Map an AssessmentAnalysis to the bind parameters of _SAVE_ANALYSIS_SQL."""
+        # orjson returns bytes; the jsonb CAST binds text
+        analysis_parameters = orjson.dumps({
+            'parcel_id': analysis.parcel_id,
+            'address': analysis.address,
+            'total_val_cents': analysis.total_val_cents,
+            'assess_val_cents': analysis.assess_val_cents,
+            'current_ratio': analysis.current_ratio,
+            'median_comparable_value_cents': analysis.median_comparable_value_cents,
+            'interpretation': analysis.interpretation,
+            'appeal_strength': analysis.appeal_strength,
+            'estimated_five_year_savings_cents': analysis.estimated_five_year_savings_cents
+        }).decode()
+
+        return {
+            'property_id': uuid.UUID(analysis.property_id),
+            'analysis_date': analysis.analysis_date.date(),
+            'fairness_score': analysis.fairness_score,
+            'assessment_ratio': float(analysis.current_ratio),
+            'comparable_count': analysis.comparable_count,
+            'recommended_action': analysis.recommended_action,
+            'estimated_savings_cents': analysis.estimated_annual_savings_cents,
+            'confidence_level': analysis.confidence,
+            'ml_model_version': analysis.model_version,
+            'analysis_parameters': analysis_parameters
+        }
+
+    def _get_property_data(self, property_id: str) -> Optional[_PropertyRecord]:
         """
         Retrieve property data from database.
 
@@ -594,39 +804,65 @@ class AssessmentAnalyzer:
             property_id: Parcel ID to retrieve
 
         Returns:
-            Dictionary with property data, or None if not found
+            _PropertyRecord with property data, or None if not found
         """
-        query = text("""
-            SELECT
-                id,
-                parcel_id,
-                ph_add AS address,
-                total_val_cents,
-                assess_val_cents,
-                acre_area,
-                ow_name AS owner_name
-            FROM properties
-            WHERE parcel_id = :parcel_id
-                AND is_active = true
-            LIMIT 1
-        """)
-
         with self._get_connection() as conn:
-            result = conn.execute(query, {"parcel_id": property_id})
+            result = conn.execute(_GET_PROPERTY_SQL, {"parcel_id": property_id})
             row = result.fetchone()
 
         if not row:
             return None
 
-        return {
-            'id': str(row.id),
-            'parcel_id': row.parcel_id,
-            'address': row.address,
-            'total_val_cents': int(row.total_val_cents) if row.total_val_cents else 0,
-            'assess_val_cents': int(row.assess_val_cents) if row.assess_val_cents else 0,
-            'acreage': float(row.acre_area) if row.acre_area else 0,
-            'owner_name': row.owner_name
-        }
+        return self._row_to_property_data(row)
+
+    def _get_properties_bulk(self, parcel_ids: List[str]) -> Dict[str, _PropertyRecord]:
+        """
+        Retrieve property data for many parcels in a single query.
+
+        Args:
+            parcel_ids: Parcel IDs to retrieve
+
+        Returns:
+            Dictionary mapping parcel_id to property data; missing or inactive
+            parcels are absent from the result
+        """
+        properties: Dict[str, _PropertyRecord] = {}
+        if not parcel_ids:
+            return properties
+
+        with self._get_connection() as conn:
+            result = conn.execute(_GET_PROPERTIES_BULK_SQL, {"parcel_ids": parcel_ids})
+            for row in result.fetchall():
+                # Keep the first row per parcel, matching _get_property_data's LIMIT 1
+                if row.parcel_id not in properties:
+                    properties[row.parcel_id] = self._row_to_property_data(row)
+        return properties
+
+    def _default_workers(self, batch_size: int) -> int:
+        """Worker threads per batch, capped by the Engine's connection pool size."""
+        workers = min(32, batch_size)
+        pool_size = getattr(getattr(self.db, "pool", None), "size", None)
+        if isinstance(self.db, Engine) and callable(pool_size):
+            # Each worker holds a pooled connection; keep one for the prefetch thread
+            workers = min(workers, max(1, pool_size() - 1))
+        return workers
+
+    def _prefetch_comparables(self, parcel_ids: List[str], limit: int) -> None:
+        """Warm ComparableService's cache for every parcel with one bulk query."""
+        self.comparable_service.find_comparables_bulk(parcel_ids, limit=limit)
+
+    @staticmethod
+    def _row_to_property_data(row: Any) -> _PropertyRecord:
+        """Convert a properties row into the record used by the analysis pipeline."""
+        return _PropertyRecord(
+            id=str(row.id),
+            parcel_id=row.parcel_id,
+            address=row.address,
+            total_val_cents=int(row.total_val_cents) if row.total_val_cents else 0,
+            assess_val_cents=int(row.assess_val_cents) if row.assess_val_cents else 0,
+            acreage=float(row.acre_area) if row.acre_area else 0,
+            owner_name=row.owner_name,
+        )
 
     def _determine_recommendation(
         self,
@@ -690,35 +926,15 @@ class AssessmentAnalyzer:
         Returns:
             Tuple of (recommended_action, appeal_strength)
         """
-        # Strong appeal case - significantly over-assessed
-        if fairness_score <= 40 and over_assessment_cents >= 1000000 and savings_cents >= 10000:  # $10k over, $100+ savings
-            return ("APPEAL", "STRONG")
-
-        # Moderate appeal case
-        elif fairness_score <= 60 and over_assessment_cents >= 500000 and savings_cents >= 5000:  # $5k over, $50+ savings
-            return ("APPEAL", "MODERATE")
-
-        # Monitor case - slightly above comparables
-        elif fairness_score <= 75 and over_assessment_cents > 0:
-            return ("MONITOR", "WEAK")
-
-        # No action needed - property is at or below comparable median
-        else:
-            return ("NONE", None)
+        code = _recommendation_code(fairness_score, over_assessment_cents, savings_cents)
+        return _RECOMMENDATIONS[code]
 
     def _get_connection(self):
         """Get a database connection context manager."""
-        if isinstance(self.db, Engine):
+        if self._conn_ctx is None:
             return self.db.connect()
-        else:
-            # Already a connection, return a no-op context manager
-            from contextlib import contextmanager
-
-            @contextmanager
-            def no_op():
-                yield self.db
-
-            return no_op()
+        # Already a connection, reuse the no-op context manager built in __init__
+        return self._conn_ctx
 
 
 # ============================================================================
@@ -760,20 +976,25 @@ if __name__ == "__main__":
 
         # Get 3 random properties with valid assessment data
         print("Fetching 3 random properties from database...")
-        query = text("""
+        query = """
             SELECT parcel_id
-            FROM properties
+            FROM properties TABLESAMPLE SYSTEM (1)
             WHERE assess_val_cents > 0
                 AND total_val_cents > 0
                 AND parcel_id IS NOT NULL
                 AND is_active = true
-            ORDER BY RANDOM()
             LIMIT 3
-        """)
+        """
 
-        with engine.connect() as conn:
-            result = conn.execute(query)
-            property_ids = [row.parcel_id for row in result.fetchall()]
+        # Single-column lookup: read straight from the DB-API cursor rather than
+        # building SQLAlchemy Row objects
+        with engine.raw_connection() as raw_conn:
+            cursor = raw_conn.cursor()
+            try:
+                cursor.execute(query)
+                property_ids = [row[0] for row in cursor.fetchall()]
+            finally:
+                cursor.close()
 
         if not property_ids:
             print("ERROR: No valid properties found in database!")
@@ -782,53 +1003,58 @@ if __name__ == "__main__":
         print(f"Found properties: {', '.join(property_ids)}")
         print()
 
-        # Analyze each property
+        # Analyze all properties together: one bulk property lookup and one
+        # comparables query instead of a round-trip per parcel
+        analyses = {
+            analysis.parcel_id: analysis
+            for analysis in analyzer.analyze_batch(property_ids, include_comparables=True)
+        }
+
+        rule = "=" * 80
         for i, prop_id in enumerate(property_ids, 1):
-            print("\n" + "=" * 80)
-            print(f"ANALYSIS #{i}: Property {prop_id}")
-            print("=" * 80)
+            # Build each property's report and write it in one call
+            parts = ["", rule, f"ANALYSIS #{i}: Property {prop_id}", rule]
+            analysis = analyses.get(prop_id)
+
+            if analysis:
+                value_diff = analysis.total_val_cents - analysis.median_comparable_value_cents
+                parts += [
+                    str(analysis),
+                    "",
+                    "DETAILED INSIGHTS:",
+                    "-" * 80,
+                    "Market Value Comparison:",
+                    f"  Your market value: ${analysis.total_val_cents / 100:,.2f}",
+                    f"  Median comparable value: ${analysis.median_comparable_value_cents / 100:,.2f}",
+                    f"  Difference: ${value_diff / 100:,.2f}",
+                    "",
+                ]
+
+                if analysis.recommended_action == "APPEAL":
+                    parts += [
+                        f"APPEAL RECOMMENDATION ({analysis.appeal_strength} case):",
+                        "  This property appears to be over-assessed compared to similar properties.",
+                        f"  A successful appeal could save ${analysis.estimated_annual_savings_dollars:,.2f} per year.",
+                        f"  Over 5 years, that's ${analysis.estimated_five_year_savings_dollars:,.2f} in savings!",
+                    ]
+                elif analysis.recommended_action == "MONITOR":
+                    parts += [
+                        "MONITOR RECOMMENDATION:",
+                        "  This property may be slightly over-assessed.",
+                        "  Monitor for changes and consider appealing if values increase further.",
+                    ]
+                else:
+                    parts += [
+                        "NO ACTION NEEDED:",
+                        "  This property appears to be fairly assessed relative to similar properties.",
+                    ]
 
-            try:
-                analysis = analyzer.analyze_property(prop_id)
-
-                if analysis:
-                    print(analysis)
-                    print()
-
-                    # Additional insights
-                    print("DETAILED INSIGHTS:")
-                    print("-" * 80)
-                    print(f"Market Value Comparison:")
-                    print(f"  Your market value: ${analysis.total_val_cents / 100:,.2f}")
-                    print(f"  Median comparable value: ${analysis.median_comparable_value_cents / 100:,.2f}")
-                    value_diff = analysis.total_val_cents - analysis.median_comparable_value_cents
-                    print(f"  Difference: ${value_diff / 100:,.2f}")
-                    print()
-
-                    if analysis.recommended_action == "APPEAL":
-                        print(f"APPEAL RECOMMENDATION ({analysis.appeal_strength} case):")
-                        print(f"  This property appears to be over-assessed compared to similar properties.")
-                        print(f"  A successful appeal could save ${analysis.estimated_annual_savings_dollars:,.2f} per year.")
-                        print(f"  Over 5 years, that's ${analysis.estimated_five_year_savings_dollars:,.2f} in savings!")
-                    elif analysis.recommended_action == "MONITOR":
-                        print(f"MONITOR RECOMMENDATION:")
-                        print(f"  This property may be slightly over-assessed.")
-                        print(f"  Monitor for changes and consider appealing if values increase further.")
-                    else:
-                        print(f"NO ACTION NEEDED:")
-                        print(f"  This property appears to be fairly assessed relative to similar properties.")
+                parts.append("")
 
-                    print()
+            else:
+                parts.append(f"Could not analyze property {prop_id} (not found or insufficient data)")
 
-                else:
-                    print(f"Could not analyze property {prop_id} (insufficient data)")
-
-            except PropertyNotFoundError:
-                print(f"ERROR: Property {prop_id} not found in database")
-            except Exception as e:
-                print(f"ERROR: Failed to analyze property {prop_id}: {e}")
-                import traceback
-                traceback.print_exc()
+            sys.stdout.write("\n".join(parts) + "\n")
 
         print("\n" + "=" * 80)
         print("TEST COMPLETED SUCCESSFULLY")
@@ -0,0 +1,171 @@
+"""
+Assessment Analysis Data Models
+
+This module contains the AssessmentAnalysis result dataclass. It has no database
+or service dependencies so workers and serializers can import it on its own.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Optional, Dict, Any
+
+
+# Section rule for __str__, built once rather than per call
+_RULE = "=" * 70
+
+
+@lru_cache(maxsize=32)
+def _iso_date(analysis_date: datetime) -> str:
+    """ISO string for an analysis date; a batch shares one date, so this formats once."""
+    return analysis_date.isoformat()
+
+
+@lru_cache(maxsize=32)
+def _report_date(analysis_date: datetime) -> str:
+    """Report-style string for an analysis date, cached like _iso_date."""
+    return f"{analysis_date:%Y-%m-%d %H:%M:%S}"
+
+
+@dataclass(slots=True)
+class AssessmentAnalysis:
+    """
+    Complete assessment analysis result for a property using SALES COMPARISON APPROACH.
+
+    This dataclass combines results from all services into a single comprehensive
+    report suitable for display to users or storage in database.
+
+    SCORING (from taxpayer perspective):
+    - Higher fairness_score = fairer assessment (less likely over-assessed)
+    - Lower fairness_score = more likely over-assessed (better appeal candidate)
+    - 90-100: Fairly assessed (at or below comparable median)
+    - 70-89: Slightly above comparables (probably fair)
+    - 50-69: Moderately above comparables (worth reviewing)
+    - 30-49: Significantly above comparables (appeal candidate)
+    - 0-29: Greatly above comparables (strong appeal candidate)
+    """
+    # Property identification
+    property_id: str
+    parcel_id: Optional[str]
+    address: str
+
+    # Current values (all in cents)
+    total_val_cents: int
+    assess_val_cents: int
+    current_ratio: float  # assess_val / total_val (always ~20% for Benton County)
+
+    # Analysis results from FairnessScorer (SALES COMPARISON APPROACH)
+    fairness_score: int  # 0-100 (higher = FAIRER, lower = appeal candidate)
+    confidence: int  # 0-100 (confidence in the analysis)
+    interpretation: str  # "FAIR", "POTENTIALLY_OVER_ASSESSED", "OVER_ASSESSED"
+
+    # Comparables summary from ComparableService
+    comparable_count: int
+    median_comparable_value_cents: int  # Median total market value of comparables (in cents)
+
+    # Savings estimate from SavingsEstimator
+    estimated_annual_savings_cents: int
+    estimated_five_year_savings_cents: int
+
+    # Recommendation logic
+    recommended_action: str  # "APPEAL", "MONITOR", "NONE"
+
+    # Metadata
+    analysis_date: datetime
+
+    # Fields with default values must come last
+    appeal_strength: Optional[str] = None  # "STRONG", "MODERATE", "WEAK" (None if no appeal)
+    comparables: List[Any] = field(default_factory=list)  # List of ComparableProperty objects
+    model_version: str = "1.0.0"
+
+    # Backward compatibility property
+    @property
+    def median_comparable_ratio(self) -> float:
+        """Backward compatibility - returns median_comparable_value_cents."""
+        return float(self.median_comparable_value_cents)
+
+    def fetch_comparables(self, comparable_service: Any, limit: int = 20) -> List[Any]:
+        """
+        Return the comparables, querying them if this result was built without them.
+
+        AssessmentAnalyzer.analyze_batch leaves comparables empty by default to keep
+        large batches small; this re-runs the lookup for the one result being shown.
+
+        Args:
+            comparable_service: ComparableService to query with
+            limit: Maximum number of comparables to load (default: 20)
+
+        Returns:
+            List of ComparableProperty objects
+        """
+        if not self.comparables and self.parcel_id:
+            self.comparables = comparable_service.find_comparables(self.parcel_id, limit=limit)
+        return self.comparables
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization or database storage."""
+        return {
+            'property_id': self.property_id,
+            'parcel_id': self.parcel_id,
+            'address': self.address,
+            'total_val_cents': self.total_val_cents,
+            'assess_val_cents': self.assess_val_cents,
+            'current_ratio': round(self.current_ratio, 4),
+            'fairness_score': self.fairness_score,
+            'confidence': self.confidence,
+            'interpretation': self.interpretation,
+            'comparable_count': self.comparable_count,
+            'median_comparable_value_cents': self.median_comparable_value_cents,
+            'estimated_annual_savings_cents': self.estimated_annual_savings_cents,
+            'estimated_five_year_savings_cents': self.estimated_five_year_savings_cents,
+            'recommended_action': self.recommended_action,
+            'appeal_strength': self.appeal_strength,
+            'analysis_date': _iso_date(self.analysis_date),
+            'model_version': self.model_version
+        }
+
+    @property
+    def total_val_dollars(self) -> float:
+        """Total market value in dollars."""
+        return self.total_val_cents / 100.0
+
+    @property
+    def assess_val_dollars(self) -> float:
+        """Assessed value in dollars."""
+        return self.assess_val_cents / 100.0
+
+    @property
+    def estimated_annual_savings_dollars(self) -> float:
+        """Estimated annual savings in dollars."""
+        return self.estimated_annual_savings_cents / 100.0
+
+    @property
+    def estimated_five_year_savings_dollars(self) -> float:
+        """Estimated 5-year savings in dollars."""
+        return self.estimated_five_year_savings_cents / 100.0
+
+    def __str__(self) -> str:
+        """Human-readable string representation."""
+        # Single f-string so the whole report is built in one pass
+        strength = f" ({self.appeal_strength} case)" if self.appeal_strength else ""
+        return (
+            f"Assessment Analysis for {self.address}\n"
+            f"{_RULE}\n"
+            f"Property ID: {self.property_id} (Parcel: {self.parcel_id})\n"
+            f"Total Value: ${self.total_val_dollars:,.2f}\n"
+            f"Assessed Value: ${self.assess_val_dollars:,.2f} ({self.current_ratio:.2%})\n"
+            f"\n"
+            f"Fairness Analysis:\n"
+            f"  Score: {self.fairness_score}/100 ({self.interpretation})\n"
+            f"  Confidence: {self.confidence}/100\n"
+            f"  Comparables: {self.comparable_count} properties\n"
+            f"  Median Comparable Value: ${self.median_comparable_value_cents / 100:,.2f}\n"
+            f"\n"
+            f"Potential Savings:\n"
+            f"  Annual: ${self.estimated_annual_savings_dollars:,.2f}\n"
+            f"  5-Year: ${self.estimated_five_year_savings_dollars:,.2f}\n"
+            f"\n"
+            f"Recommendation: {self.recommended_action}{strength}\n"
+            f"Analysis Date: {_report_date(self.analysis_date)}\n"
+            f"{_RULE}"
+        )
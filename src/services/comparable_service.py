@@ -36,11 +36,13 @@ Usage:
 """
 
 import logging
+import threading
+import time
 from dataclasses import dataclass
-from decimal import Decimal
-from typing import List, Optional, Dict, Any
+from operator import attrgetter
+from typing import Callable, List, NamedTuple, Optional, Dict, Any, Tuple
 
-from sqlalchemy import text
+from sqlalchemy import BigInteger, Float, Integer, String, bindparam, text
 from sqlalchemy.engine import Engine, Connection
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -75,7 +77,7 @@ class DatabaseError(ServiceError):
 # DATA MODELS
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComparableProperty:
     """
     Represents a comparable property with similarity metrics.
@@ -146,7 +148,7 @@ class ComparableProperty:
         return self.match_type == "PROXIMITY"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PropertyCriteria:
     """
     Criteria for finding comparable properties.
@@ -188,11 +190,24 @@ class PropertyCriteria:
             raise ValueError("longitude must be between -180 and 180")
 
 
+class _PropertySummaryRow(NamedTuple):
+    """Subject property columns read by get_property_summary."""
+    parcel_id: str
+    property_type: Optional[str]
+    total_val_cents: Optional[int]
+    assess_val_cents: Optional[int]
+    acre_area: Optional[float]
+    address: Optional[str]
+    subdivision: Optional[str]
+    owner_name: Optional[str]
+    assessment_ratio: Any
+
+
 # ============================================================================
 # SERVICE CONFIGURATION
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ComparableConfig:
     """Configuration for comparable property matching."""
     min_comparables: int = 5
@@ -200,6 +215,481 @@ class ComparableConfig:
     radius_miles: float = 0.5
     value_tolerance: float = 0.20  # ±20%
     acreage_tolerance: float = 0.25  # ±25%
+    cache_size: int = 4096  # cached lookups kept per service instance
+    cache_ttl_seconds: float = 300.0  # 0 disables the lookup cache
+
+
+class _TTLCache:
+    """Thread-safe cache whose entries expire after a fixed TTL; oldest evicted first."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Any, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store a value, evicting the oldest entries when full."""
+        if self.ttl <= 0 or self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data.pop(key, None)
+            while len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def discard(self, predicate: Callable[[Any], bool]) -> None:
+        """Drop every entry whose key matches predicate."""
+        with self._lock:
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._data.clear()
+
+
+# ============================================================================
+# SQL STATEMENTS
+# ============================================================================
+
+# Sales Comparison Approach Query
+# Priority: Same subdivision > Same type > Similar size > Similar improvements
+_COMPARABLES_QUERY_TEMPLATE = """
+    WITH subject AS (
+        SELECT
+            id,
+            parcel_id,
+            type_,
+            subdivname,
+            acre_area,
+            total_val_cents,
+            assess_val_cents,
+            land_val_cents,
+            imp_val_cents,
+            geog
+        FROM properties
+        WHERE parcel_id = :parcel_id
+          AND is_active = true
+        LIMIT 1
+    ),
+
+    -- Find comparables prioritizing subdivision match
+    comparables AS (
+        SELECT
+            p.parcel_id AS comparable_parcelid,
+            p.ph_add AS property_address,
+            p.total_val_cents AS total_value,
+            p.assess_val_cents AS assess_value,
+            p.land_val_cents AS land_value,
+            p.imp_val_cents AS imp_value,
+            p.acre_area,
+            p.type_ AS property_type,
+            p.ow_name AS owner_name,
+            p.subdivname AS subdivision,
+
+            -- Match type: SUBDIVISION or PROXIMITY
+            CASE
+                WHEN p.subdivname = s.subdivname AND p.subdivname IS NOT NULL
+                THEN 'SUBDIVISION'
+                ELSE 'PROXIMITY'
+            END AS match_type,
+
+            -- Distance (0 for subdivision matches, 999 when either geometry is missing)
+            COALESCE(d.miles, 999.0) AS distance_miles,
+
+            -- Assessment ratio (always ~20% but include for reference)
+            p.assessment_ratio_pct AS assessment_ratio,
+
+            -- Value difference percentage
+            CASE
+                WHEN s.total_val_cents > 0
+                THEN ABS(p.total_val_cents - s.total_val_cents)::float8 / s.total_val_cents * 100
+                ELSE 0
+            END AS value_difference_pct,
+
+            -- Acreage difference percentage
+            CASE
+                WHEN s.acre_area > 0.01
+                THEN ABS(p.acre_area - s.acre_area) / s.acre_area * 100
+                ELSE 0
+            END AS acreage_difference_pct,
+
+            -- Improvement value difference percentage
+            CASE
+                WHEN s.imp_val_cents > 0
+                THEN ABS(p.imp_val_cents - s.imp_val_cents)::float8 / s.imp_val_cents * 100
+                ELSE 0
+            END AS imp_difference_pct,
+
+            -- SCORING COMPONENTS (float8 throughout; rounded only in the final SELECT)
+            -- Type match: 100 if same type
+            CASE WHEN p.type_ = s.type_ THEN 100.0::float8 ELSE 0.0::float8 END AS type_match_score,
+
+            -- Value similarity score (closer = higher score)
+            GREATEST(0, 100 - (
+                CASE
+                    WHEN s.total_val_cents > 0
+                    THEN ABS(p.total_val_cents - s.total_val_cents)::float8 / s.total_val_cents * 100
+                    ELSE 100
+                END
+            )) AS value_match_score,
+
+            -- Acreage similarity score
+            GREATEST(0, 100 - (
+                CASE
+                    WHEN s.acre_area > 0.01
+                    THEN ABS(p.acre_area - s.acre_area) / s.acre_area * 100
+                    ELSE 100
+                END
+            )) AS acreage_match_score,
+
+            -- Location score (subdivision match = 100, proximity decreases with distance)
+            CASE
+                WHEN p.subdivname = s.subdivname AND p.subdivname IS NOT NULL THEN 100.0::float8
+                WHEN d.miles IS NOT NULL THEN
+                    GREATEST(0, 100 - d.miles * 50)  -- Penalize distance
+                ELSE 0.0::float8
+            END AS location_score,
+
+            -- Improvement similarity score (key for sales comparison)
+            GREATEST(0, 100 - (
+                CASE
+                    WHEN s.imp_val_cents > 0
+                    THEN ABS(p.imp_val_cents - s.imp_val_cents)::float8 / s.imp_val_cents * 100
+                    ELSE
+                        CASE WHEN p.imp_val_cents > 0 THEN 100 ELSE 0 END
+                END
+            )) AS improvement_match_score
+
+        FROM properties p, subject s,
+            -- Pair distance in miles, computed once and shared by distance_miles
+            -- and location_score; subdivision matches skip the geography math
+            LATERAL (
+                SELECT CASE
+                    WHEN p.subdivname = s.subdivname AND p.subdivname IS NOT NULL THEN 0.0
+                    WHEN p.geog IS NOT NULL AND s.geog IS NOT NULL THEN
+                        ST_Distance(p.geog, s.geog) * 0.000621371  -- meters to miles
+                END AS miles
+            ) d
+        WHERE p.parcel_id != s.parcel_id
+          AND p.is_active = true
+          AND p.total_val_cents > 0
+          -- MUST be same property type
+          AND p.type_ = s.type_
+          {candidate_filter}
+    ),
+
+    -- Overall similarity score (weighted), computed once for output and ordering
+    scored AS (
+        SELECT
+            c.*,
+            c.type_match_score * 0.05 +        -- 5% type (already filtered)
+            c.location_score * 0.35 +          -- 35% location (subdivision is key)
+            c.value_match_score * 0.20 +       -- 20% value similarity
+            c.acreage_match_score * 0.15 +     -- 15% lot size
+            c.improvement_match_score * 0.25   -- 25% improvement value
+            AS similarity_raw
+        FROM comparables c
+    )
+
+    SELECT
+        c.comparable_parcelid,
+        c.match_type,
+        ROUND(c.distance_miles::numeric, 3)::float AS distance_miles,
+        ROUND(c.similarity_raw::numeric, 2)::float AS similarity_score,
+        c.total_value,
+        c.assess_value,
+        COALESCE(c.land_value, 0) AS land_value,
+        COALESCE(c.imp_value, 0) AS imp_value,
+        ROUND(c.acre_area::numeric, 3)::float AS acre_area,
+        c.property_type,
+        c.owner_name,
+        COALESCE(c.property_address, '') AS property_address,
+        c.subdivision,
+        c.assessment_ratio::float AS assessment_ratio,
+        ROUND(c.value_difference_pct::numeric, 2)::float AS value_difference_pct,
+        ROUND(c.acreage_difference_pct::numeric, 2)::float AS acreage_difference_pct,
+        ROUND(c.type_match_score::numeric, 2)::float AS type_match_score,
+        ROUND(c.value_match_score::numeric, 2)::float AS value_match_score,
+        ROUND(c.acreage_match_score::numeric, 2)::float AS acreage_match_score,
+        ROUND(c.location_score::numeric, 2)::float AS location_score
+    FROM scored c
+    ORDER BY
+        -- Prioritize subdivision matches
+        CASE WHEN c.match_type = 'SUBDIVISION' THEN 0 ELSE 1 END,
+        -- Then by overall similarity
+        c.similarity_raw DESC
+    LIMIT :limit
+"""
+
+# Candidate filters for the {candidate_filter} slot. Subdivision matches always
+# rank ahead of proximity matches, so the two branches can also run separately.
+_SUBDIVISION_MATCH_FILTER = """
+          -- Same subdivision: relax other constraints
+          AND p.subdivname = s.subdivname AND p.subdivname IS NOT NULL
+"""
+
+_PROXIMITY_MATCH_FILTER = """
+          -- Different subdivision: must be similar size and value
+          AND (p.subdivname IS DISTINCT FROM s.subdivname OR p.subdivname IS NULL)
+          AND p.acre_area BETWEEN s.acre_area * 0.5 AND s.acre_area * 2.0
+          AND p.total_val_cents BETWEEN s.total_val_cents * 0.3 AND s.total_val_cents * 3.0
+"""
+
+_ANY_MATCH_FILTER = """
+          -- Either same subdivision OR within reasonable value range
+          AND (
+              (p.subdivname = s.subdivname AND p.subdivname IS NOT NULL)
+              OR
+              (
+                  p.acre_area BETWEEN s.acre_area * 0.5 AND s.acre_area * 2.0
+                  AND p.total_val_cents BETWEEN s.total_val_cents * 0.3 AND s.total_val_cents * 3.0
+              )
+          )
+"""
+
+_FIND_COMPARABLES_QUERY = _COMPARABLES_QUERY_TEMPLATE.replace(
+    "{candidate_filter}", _ANY_MATCH_FILTER
+)
+
+# Bind parameter types declared up front so execution skips type inference
+_PARCEL_ID_PARAM = bindparam("parcel_id", type_=String)
+_LIMIT_PARAM = bindparam("limit", type_=Integer)
+
+# find_comparables runs the index-backed subdivision branch first and only
+# falls back to the proximity branch when it returns fewer than :limit rows.
+_FIND_SUBDIVISION_COMPARABLES_SQL = text(_COMPARABLES_QUERY_TEMPLATE.replace(
+    "{candidate_filter}", _SUBDIVISION_MATCH_FILTER
+)).bindparams(_PARCEL_ID_PARAM, _LIMIT_PARAM)
+
+_FIND_PROXIMITY_COMPARABLES_SQL = text(_COMPARABLES_QUERY_TEMPLATE.replace(
+    "{candidate_filter}", _PROXIMITY_MATCH_FILTER
+)).bindparams(_PARCEL_ID_PARAM, _LIMIT_PARAM)
+
+# The same query run once per subject parcel via LATERAL, so a whole batch of
+# subjects is matched in one round-trip. Rows carry subject_parcel_id.
+_FIND_COMPARABLES_BULK_SQL = text(f"""
+    SELECT ids.subject_parcel_id, c.*
+    FROM unnest(CAST(:parcel_ids AS text[])) AS ids(subject_parcel_id)
+    CROSS JOIN LATERAL ({_FIND_COMPARABLES_QUERY.replace(":parcel_id", "ids.subject_parcel_id")}) c
+""")
+
+# Criteria-based search, mirroring the SQL function logic.
+# NOTE: Scoring math runs in DOUBLE PRECISION; ROUND() needs NUMERIC, so values
+# are cast to NUMERIC only when rounded in the final SELECT.
+# Use CAST() syntax instead of :: to avoid SQLAlchemy parameter parsing issues.
+_FIND_COMPARABLES_BY_CRITERIA_SQL = text("""
+    WITH target_property AS (
+        SELECT
+            :property_type AS type_,
+            CAST(:total_val_cents AS BIGINT) AS total_val_cents,
+            CAST(:acreage AS DOUBLE PRECISION) AS acre_area,
+            :subdivision AS subdivname,
+            CAST(ST_SetSRID(ST_MakePoint(:longitude, :latitude), 4326) AS geography) AS point_geog
+    ),
+
+    all_candidates AS (
+        -- Subdivision matches
+        SELECT
+            p.parcel_id,
+            CAST('SUBDIVISION' AS VARCHAR) AS match_type,
+            CAST(0.0 AS DOUBLE PRECISION) AS distance_miles,
+            p.type_,
+            p.total_val_cents,
+            p.assess_val_cents,
+            p.land_val_cents,
+            p.imp_val_cents,
+            p.acre_area,
+            p.ow_name,
+            p.ph_add,
+            p.subdivname,
+            p.geometry
+        FROM properties p, target_property t
+        WHERE p.subdivname = t.subdivname
+            AND p.subdivname IS NOT NULL
+            AND p.is_active = true
+            AND p.type_ = t.type_
+            AND p.total_val_cents BETWEEN t.total_val_cents * 0.80 AND t.total_val_cents * 1.20
+            AND p.acre_area BETWEEN t.acre_area * 0.75 AND t.acre_area * 1.25
+            AND p.total_val_cents > 0
+            AND p.acre_area > 0
+
+        UNION ALL
+
+        -- Proximity matches (fallback)
+        SELECT
+            p.parcel_id,
+            CAST('PROXIMITY' AS VARCHAR) AS match_type,
+            ST_Distance(p.geog, t.point_geog) * 0.000621371 AS distance_miles,
+            p.type_,
+            p.total_val_cents,
+            p.assess_val_cents,
+            p.land_val_cents,
+            p.imp_val_cents,
+            p.acre_area,
+            p.ow_name,
+            p.ph_add,
+            p.subdivname,
+            p.geometry
+        FROM properties p, target_property t
+        -- Radius search on the stored geography so idx_properties_geog_active applies
+        WHERE ST_DWithin(p.geog, t.point_geog, 804.67)  -- 0.5 miles in meters
+            AND p.is_active = true
+            AND p.type_ = t.type_
+            AND p.total_val_cents BETWEEN t.total_val_cents * 0.80 AND t.total_val_cents * 1.20
+            AND p.acre_area BETWEEN t.acre_area * 0.75 AND t.acre_area * 1.25
+            AND p.total_val_cents > 0
+            AND p.acre_area > 0
+    ),
+
+    scored_comparables AS (
+        SELECT
+            ac.parcel_id,
+            ac.match_type,
+            ac.distance_miles,
+            ac.total_val_cents,
+            ac.assess_val_cents,
+            ac.land_val_cents,
+            ac.imp_val_cents,
+            ac.acre_area,
+            ac.type_,
+            ac.ow_name,
+            ac.ph_add,
+            ac.subdivname,
+
+            -- Assessment ratio
+            CASE
+                WHEN ac.total_val_cents > 0 THEN
+                    CAST(ac.assess_val_cents AS DOUBLE PRECISION) / ac.total_val_cents * 100
+                ELSE CAST(0 AS DOUBLE PRECISION)
+            END AS assessment_ratio,
+
+            -- Difference percentages
+            CAST(ABS(ac.total_val_cents - CAST(:total_val_cents AS BIGINT)) AS DOUBLE PRECISION) /
+                NULLIF(CAST(:total_val_cents AS DOUBLE PRECISION), 0) * 100 AS value_difference_pct,
+
+            ABS(ac.acre_area - CAST(:acreage AS DOUBLE PRECISION)) /
+                NULLIF(CAST(:acreage AS DOUBLE PRECISION), 0) * 100 AS acreage_difference_pct,
+
+            -- Score components (DOUBLE PRECISION; rounded in the final SELECT)
+            CAST(100.0 AS DOUBLE PRECISION) AS type_match_score,
+
+            GREATEST(CAST(0 AS DOUBLE PRECISION), 100 - (
+                CAST(ABS(ac.total_val_cents - CAST(:total_val_cents AS BIGINT)) AS DOUBLE PRECISION) /
+                NULLIF(CAST(:total_val_cents AS DOUBLE PRECISION), 0) * 100 * 5
+            )) AS value_match_score,
+
+            GREATEST(CAST(0 AS DOUBLE PRECISION), 100 - (
+                ABS(ac.acre_area - CAST(:acreage AS DOUBLE PRECISION)) /
+                NULLIF(CAST(:acreage AS DOUBLE PRECISION), 0) * 100 * 4
+            )) AS acreage_match_score,
+
+            CASE
+                WHEN ac.match_type = 'SUBDIVISION' THEN CAST(100.0 AS DOUBLE PRECISION)
+                WHEN ac.match_type = 'PROXIMITY' THEN
+                    GREATEST(CAST(0 AS DOUBLE PRECISION), 100 - (ac.distance_miles * 200))
+                ELSE CAST(0 AS DOUBLE PRECISION)
+            END AS location_score
+        FROM all_candidates ac
+    )
+
+    SELECT
+        sc.parcel_id AS comparable_parcelid,
+        sc.match_type,
+        CAST(ROUND(CAST(sc.distance_miles AS NUMERIC), 3) AS DOUBLE PRECISION) AS distance_miles,
+
+        -- Weighted similarity score
+        CAST(ROUND(CAST(
+            (sc.type_match_score * 0.10) +
+            (sc.value_match_score * 0.35) +
+            (sc.acreage_match_score * 0.30) +
+            (sc.location_score * 0.25)
+        AS NUMERIC), 2) AS DOUBLE PRECISION) AS similarity_score,
+
+        sc.total_val_cents AS total_value,
+        sc.assess_val_cents AS assess_value,
+        COALESCE(sc.land_val_cents, 0) AS land_value,
+        COALESCE(sc.imp_val_cents, 0) AS imp_value,
+        CAST(ROUND(CAST(sc.acre_area AS NUMERIC), 2) AS DOUBLE PRECISION) AS acre_area,
+        sc.type_ AS property_type,
+        sc.ow_name AS owner_name,
+        COALESCE(sc.ph_add, '') AS property_address,
+        sc.subdivname AS subdivision,
+        CAST(ROUND(CAST(sc.assessment_ratio AS NUMERIC), 2) AS DOUBLE PRECISION) AS assessment_ratio,
+        CAST(ROUND(CAST(sc.value_difference_pct AS NUMERIC), 2) AS DOUBLE PRECISION) AS value_difference_pct,
+        CAST(ROUND(CAST(sc.acreage_difference_pct AS NUMERIC), 2) AS DOUBLE PRECISION) AS acreage_difference_pct,
+        CAST(ROUND(CAST(sc.type_match_score AS NUMERIC), 2) AS DOUBLE PRECISION) AS type_match_score,
+        CAST(ROUND(CAST(sc.value_match_score AS NUMERIC), 2) AS DOUBLE PRECISION) AS value_match_score,
+        CAST(ROUND(CAST(sc.acreage_match_score AS NUMERIC), 2) AS DOUBLE PRECISION) AS acreage_match_score,
+        CAST(ROUND(CAST(sc.location_score AS NUMERIC), 2) AS DOUBLE PRECISION) AS location_score
+
+    FROM scored_comparables sc
+    ORDER BY similarity_score DESC, sc.distance_miles ASC
+    LIMIT :limit
+""").bindparams(
+    bindparam("property_type", type_=String),
+    bindparam("total_val_cents", type_=BigInteger),
+    bindparam("acreage", type_=Float),
+    bindparam("subdivision", type_=String),
+    bindparam("latitude", type_=Float),
+    bindparam("longitude", type_=Float),
+    _LIMIT_PARAM,
+)
+
+# Subject property details and its comparables in one round-trip. Subject
+# columns are prefixed to keep them apart from the comparable columns; a subject
+# without comparables yields a single row whose comparable columns are NULL.
+_GET_PROPERTY_SUMMARY_SQL = text(f"""
+    SELECT subj.*, c.*
+    FROM (
+        SELECT
+            parcel_id AS subject_parcel_id,
+            type_ AS subject_property_type,
+            total_val_cents AS subject_total_val_cents,
+            assess_val_cents AS subject_assess_val_cents,
+            acre_area AS subject_acre_area,
+            ph_add AS subject_address,
+            subdivname AS subject_subdivision,
+            ow_name AS subject_owner_name,
+            assessment_ratio_pct AS subject_assessment_ratio
+        FROM properties
+        WHERE parcel_id = :parcel_id
+        LIMIT 1
+    ) subj
+    LEFT JOIN LATERAL ({_FIND_COMPARABLES_QUERY}) c ON true
+""").bindparams(_PARCEL_ID_PARAM, _LIMIT_PARAM)
+
+_PROPERTY_EXISTS_SQL = text("""
+    SELECT 1
+    FROM properties
+    WHERE parcel_id = :parcel_id
+    LIMIT 1
+""").bindparams(_PARCEL_ID_PARAM)
+
+# Comparable row columns in ComparableProperty field order. The queries above
+# alias, cast and COALESCE these so rows can be unpacked without per-field fixes.
+_COMPARABLE_COLUMNS = attrgetter(
+    "comparable_parcelid", "comparable_parcelid", "property_address",
+    "total_value", "assess_value", "land_value", "imp_value",
+    "assessment_ratio", "acre_area", "property_type", "subdivision", "owner_name",
+    "distance_miles", "match_type", "similarity_score",
+    "value_difference_pct", "acreage_difference_pct",
+    "type_match_score", "value_match_score", "acreage_match_score", "location_score",
+)
 
 
 # ============================================================================
@@ -241,8 +731,23 @@ class ComparableService:
         """
         self.db = db_connection
         self.config = config or ComparableConfig()
+        # Read-through cache for repeated lookups of the same parcel; keys are
+        # (kind, property_id, ...) tuples so invalidate() can match on property_id
+        self._cache = _TTLCache(self.config.cache_size, self.config.cache_ttl_seconds)
         logger.info("ComparableService initialized")
 
+    def invalidate(self, property_id: Optional[str] = None) -> None:
+        """
+        Drop cached lookups for one property, or for all properties.
+
+        Args:
+            property_id: Parcel ID whose cached results to drop (default: all)
+        """
+        if property_id is None:
+            self._cache.clear()
+        else:
+            self._cache.discard(lambda key: key[1] == property_id)
+
     def find_comparables(
         self,
         property_id: str,
@@ -278,219 +783,52 @@ class ComparableService:
         if not 1 <= limit <= 50:
             raise ValueError("limit must be between 1 and 50")
 
+        cache_key = ("comparables", property_id, limit)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+
         logger.info(f"Finding comparables for property: {property_id} (limit={limit})")
 
         try:
-            # Sales Comparison Approach Query
-            # Priority: Same subdivision > Same type > Similar size > Similar improvements
-            query = text("""
-                WITH subject AS (
-                    SELECT
-                        id,
-                        parcel_id,
-                        type_,
-                        subdivname,
-                        acre_area,
-                        total_val_cents,
-                        assess_val_cents,
-                        land_val_cents,
-                        imp_val_cents,
-                        geometry
-                    FROM properties
-                    WHERE parcel_id = :parcel_id
-                      AND is_active = true
-                    LIMIT 1
-                ),
-
-                -- Find comparables prioritizing subdivision match
-                comparables AS (
-                    SELECT
-                        p.parcel_id AS comparable_parcelid,
-                        p.ph_add AS property_address,
-                        p.total_val_cents AS total_value,
-                        p.assess_val_cents AS assess_value,
-                        p.land_val_cents AS land_value,
-                        p.imp_val_cents AS imp_value,
-                        p.acre_area,
-                        p.type_ AS property_type,
-                        p.ow_name AS owner_name,
-                        p.subdivname AS subdivision,
-
-                        -- Match type: SUBDIVISION or PROXIMITY
-                        CASE
-                            WHEN p.subdivname = s.subdivname AND p.subdivname IS NOT NULL
-                            THEN 'SUBDIVISION'
-                            ELSE 'PROXIMITY'
-                        END AS match_type,
-
-                        -- Calculate distance (0 for subdivision matches)
-                        CASE
-                            WHEN p.subdivname = s.subdivname AND p.subdivname IS NOT NULL THEN 0.0
-                            WHEN p.geometry IS NOT NULL AND s.geometry IS NOT NULL THEN
-                                ST_Distance(
-                                    ST_Transform(p.geometry, 4326)::geography,
-                                    ST_Transform(s.geometry, 4326)::geography
-                                ) * 0.000621371  -- meters to miles
-                            ELSE 999.0
-                        END AS distance_miles,
-
-                        -- Assessment ratio (always ~20% but include for reference)
-                        CASE
-                            WHEN p.total_val_cents > 0
-                            THEN ROUND((p.assess_val_cents::numeric / p.total_val_cents::numeric) * 100, 2)
-                            ELSE 0
-                        END AS assessment_ratio,
-
-                        -- Value difference percentage
-                        CASE
-                            WHEN s.total_val_cents > 0
-                            THEN ROUND(ABS(p.total_val_cents - s.total_val_cents)::numeric / s.total_val_cents * 100, 2)
-                            ELSE 0
-                        END AS value_difference_pct,
-
-                        -- Acreage difference percentage
-                        CASE
-                            WHEN s.acre_area > 0.01
-                            THEN ROUND(ABS(p.acre_area::numeric - s.acre_area::numeric) / s.acre_area::numeric * 100, 2)
-                            ELSE 0
-                        END AS acreage_difference_pct,
-
-                        -- Improvement value difference percentage
-                        CASE
-                            WHEN s.imp_val_cents > 0
-                            THEN ROUND(ABS(p.imp_val_cents - s.imp_val_cents)::numeric / s.imp_val_cents * 100, 2)
-                            ELSE 0
-                        END AS imp_difference_pct,
-
-                        -- SCORING COMPONENTS
-                        -- Type match: 100 if same type
-                        CASE WHEN p.type_ = s.type_ THEN 100.0 ELSE 0.0 END AS type_match_score,
-
-                        -- Value similarity score (closer = higher score)
-                        GREATEST(0, 100 - (
-                            CASE
-                                WHEN s.total_val_cents > 0
-                                THEN ABS(p.total_val_cents - s.total_val_cents)::numeric / s.total_val_cents * 100
-                                ELSE 100
-                            END
-                        )) AS value_match_score,
-
-                        -- Acreage similarity score
-                        GREATEST(0, 100 - (
-                            CASE
-                                WHEN s.acre_area > 0.01
-                                THEN ABS(p.acre_area::numeric - s.acre_area::numeric) / s.acre_area::numeric * 100
-                                ELSE 100
-                            END
-                        )) AS acreage_match_score,
-
-                        -- Location score (subdivision match = 100, proximity decreases with distance)
-                        CASE
-                            WHEN p.subdivname = s.subdivname AND p.subdivname IS NOT NULL THEN 100.0
-                            WHEN p.geometry IS NOT NULL AND s.geometry IS NOT NULL THEN
-                                GREATEST(0, 100 - (
-                                    ST_Distance(
-                                        ST_Transform(p.geometry, 4326)::geography,
-                                        ST_Transform(s.geometry, 4326)::geography
-                                    ) * 0.000621371 * 50  -- Penalize distance
-                                ))
-                            ELSE 0.0
-                        END AS location_score,
-
-                        -- Improvement similarity score (key for sales comparison)
-                        GREATEST(0, 100 - (
-                            CASE
-                                WHEN s.imp_val_cents > 0
-                                THEN ABS(p.imp_val_cents - s.imp_val_cents)::numeric / s.imp_val_cents * 100
-                                ELSE
-                                    CASE WHEN p.imp_val_cents > 0 THEN 100 ELSE 0 END
-                            END
-                        )) AS improvement_match_score
-
-                    FROM properties p, subject s
-                    WHERE p.parcel_id != s.parcel_id
-                      AND p.is_active = true
-                      AND p.total_val_cents > 0
-                      -- MUST be same property type
-                      AND p.type_ = s.type_
-                      -- Either same subdivision OR within reasonable value range
-                      AND (
-                          -- Same subdivision: relax other constraints
-                          (p.subdivname = s.subdivname AND p.subdivname IS NOT NULL)
-                          OR
-                          -- Different subdivision: must be similar size and value
-                          (
-                              p.acre_area BETWEEN s.acre_area * 0.5 AND s.acre_area * 2.0
-                              AND p.total_val_cents BETWEEN s.total_val_cents * 0.3 AND s.total_val_cents * 3.0
-                          )
-                      )
-                )
-
-                SELECT
-                    c.comparable_parcelid,
-                    c.match_type,
-                    ROUND(c.distance_miles::numeric, 3)::float AS distance_miles,
-                    -- Overall similarity score (weighted)
-                    ROUND((
-                        c.type_match_score::numeric * 0.05 +        -- 5% type (already filtered)
-                        c.location_score::numeric * 0.35 +          -- 35% location (subdivision is key)
-                        c.value_match_score::numeric * 0.20 +       -- 20% value similarity
-                        c.acreage_match_score::numeric * 0.15 +     -- 15% lot size
-                        c.improvement_match_score::numeric * 0.25   -- 25% improvement value
-                    ), 2)::float AS similarity_score,
-                    c.total_value,
-                    c.assess_value,
-                    c.land_value,
-                    c.imp_value,
-                    ROUND(c.acre_area::numeric, 3)::float AS acre_area,
-                    c.property_type,
-                    c.owner_name,
-                    c.property_address,
-                    c.subdivision,
-                    c.assessment_ratio::float AS assessment_ratio,
-                    c.value_difference_pct::float AS value_difference_pct,
-                    c.acreage_difference_pct::float AS acreage_difference_pct,
-                    ROUND(c.type_match_score::numeric, 2)::float AS type_match_score,
-                    ROUND(c.value_match_score::numeric, 2)::float AS value_match_score,
-                    ROUND(c.acreage_match_score::numeric, 2)::float AS acreage_match_score,
-                    ROUND(c.location_score::numeric, 2)::float AS location_score
-                FROM comparables c
-                ORDER BY
-                    -- Prioritize subdivision matches
-                    CASE WHEN c.match_type = 'SUBDIVISION' THEN 0 ELSE 1 END,
-                    -- Then by overall similarity
-                    (c.type_match_score * 0.05 + c.location_score * 0.35 +
-                     c.value_match_score * 0.20 + c.acreage_match_score * 0.15 +
-                     c.improvement_match_score * 0.25) DESC
-                LIMIT :limit
-            """)
-
             with self._get_connection() as conn:
-                result = conn.execute(
-                    query,
+                rows = conn.execute(
+                    _FIND_SUBDIVISION_COMPARABLES_SQL,
                     {"parcel_id": property_id, "limit": limit}
-                )
-                rows = result.fetchall()
+                ).fetchall()
 
-            # If no results, check if property exists
-            if not rows:
-                if not self._property_exists(property_id):
+                # Skip the distance-scored fallback when the subdivision fills the limit
+                if len(rows) < limit:
+                    rows += conn.execute(
+                        _FIND_PROXIMITY_COMPARABLES_SQL,
+                        {"parcel_id": property_id, "limit": limit - len(rows)}
+                    ).fetchall()
+
+                # If no results, check if property exists on the same connection
+                if not rows and not self._property_exists(property_id, conn):
                     raise PropertyNotFoundError(property_id)
 
+            if not rows:
                 logger.warning(
                     f"No comparables found for property {property_id}. "
                     "Property may have unusual characteristics or be isolated."
                 )
+                self._cache.set(cache_key, ())
                 return []
 
             # Convert to ComparableProperty objects
             comparables = [self._row_to_comparable(row) for row in rows]
 
-            logger.info(
-                f"Found {len(comparables)} comparables for {property_id}. "
-                f"Avg similarity: {sum(c.similarity_score for c in comparables) / len(comparables):.1f}%"
-            )
+            # The average is only summed when the message will actually be emitted
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Found %d comparables for %s. Avg similarity: %.1f%%",
+                    len(comparables), property_id,
+                    sum(c.similarity_score for c in comparables) / len(comparables),
+                )
 
+            # Comparables are frozen, so callers can share them; only the list is copied
+            self._cache.set(cache_key, tuple(comparables))
             return comparables
 
         except PropertyNotFoundError:
@@ -502,6 +840,76 @@ class ComparableService:
             logger.error(f"Unexpected error finding comparables: {e}")
             raise ServiceError(f"Service error: {str(e)}") from e
 
+    def find_comparables_bulk(
+        self,
+        property_ids: List[str],
+        limit: int = 20
+    ) -> Dict[str, List[ComparableProperty]]:
+        """
+        Find comparables for many properties in a single query.
+
+        Runs the same sales comparison matching as find_comparables for each
+        subject parcel, but in one round-trip. Unlike find_comparables, missing
+        parcels are not reported as errors; they simply get no comparables.
+
+        Parcels already in the cache are served from it, and parcels that
+        match are cached so later find_comparables calls reuse them.
+
+        Args:
+            property_ids: Parcel IDs to find comparables for
+            limit: Maximum number of comparables per property (1-50)
+
+        Returns:
+            Dictionary mapping every requested parcel ID to its comparables,
+            sorted by similarity score (highest first)
+
+        Raises:
+            DatabaseError: If database operation fails
+            ValueError: If limit is out of range
+        """
+        if not 1 <= limit <= 50:
+            raise ValueError("limit must be between 1 and 50")
+
+        comparables: Dict[str, List[ComparableProperty]] = {}
+        missing = []
+        # De-duplicated so a repeated parcel is queried, and its rows appended, only once
+        for pid in dict.fromkeys(property_ids):
+            cached = self._cache.get(("comparables", pid, limit))
+            if cached is None:
+                comparables[pid] = []
+                missing.append(pid)
+            else:
+                comparables[pid] = list(cached)
+        if not missing:
+            return comparables
+
+        logger.info(f"Finding comparables for {len(missing)} properties (limit={limit})")
+
+        try:
+            with self._get_connection() as conn:
+                result = conn.execute(
+                    _FIND_COMPARABLES_BULK_SQL,
+                    {"parcel_ids": missing, "limit": limit}
+                )
+                rows = result.fetchall()
+
+            for row in rows:
+                comparables[row.subject_parcel_id].append(self._row_to_comparable(row))
+
+            # Empty results are left uncached so find_comparables still runs its existence check
+            for pid in missing:
+                if comparables[pid]:
+                    self._cache.set(("comparables", pid, limit), tuple(comparables[pid]))
+
+            return comparables
+
+        except SQLAlchemyError as e:
+            logger.error(f"Database error finding comparables in bulk: {e}")
+            raise DatabaseError(f"Database operation failed: {str(e)}") from e
+        except Exception as e:
+            logger.error(f"Unexpected error finding comparables in bulk: {e}")
+            raise ServiceError(f"Service error: {str(e)}") from e
+
     def find_comparables_by_criteria(
         self,
         criteria: PropertyCriteria,
@@ -537,173 +945,9 @@ class ComparableService:
         )
 
         try:
-            # Build inline query based on the SQL function logic
-            # NOTE: All numeric calculations must be cast to NUMERIC for ROUND() to work
-            # Use CAST() syntax instead of :: to avoid SQLAlchemy parameter parsing issues
-            query = text("""
-                WITH target_property AS (
-                    SELECT
-                        :property_type AS type_,
-                        CAST(:total_val_cents AS BIGINT) AS total_val_cents,
-                        CAST(:acreage AS NUMERIC) AS acre_area,
-                        :subdivision AS subdivname,
-                        ST_SetSRID(ST_MakePoint(:longitude, :latitude), 4326) AS point_geom
-                ),
-
-                all_candidates AS (
-                    -- Subdivision matches
-                    SELECT
-                        p.parcel_id,
-                        CAST('SUBDIVISION' AS VARCHAR) AS match_type,
-                        CAST(0.0 AS NUMERIC) AS distance_miles,
-                        p.type_,
-                        p.total_val_cents,
-                        p.assess_val_cents,
-                        p.land_val_cents,
-                        p.imp_val_cents,
-                        CAST(p.acre_area AS NUMERIC) AS acre_area,
-                        p.ow_name,
-                        p.ph_add,
-                        p.subdivname,
-                        p.geometry
-                    FROM properties p, target_property t
-                    WHERE p.subdivname = t.subdivname
-                        AND p.subdivname IS NOT NULL
-                        AND p.type_ = t.type_
-                        AND p.total_val_cents BETWEEN t.total_val_cents * 0.80 AND t.total_val_cents * 1.20
-                        AND p.acre_area BETWEEN t.acre_area * 0.75 AND t.acre_area * 1.25
-                        AND p.total_val_cents > 0
-                        AND p.acre_area > 0
-
-                    UNION ALL
-
-                    -- Proximity matches (fallback)
-                    SELECT
-                        p.parcel_id,
-                        CAST('PROXIMITY' AS VARCHAR) AS match_type,
-                        CAST(ST_Distance(
-                            CAST(ST_Transform(p.geometry, 4326) AS geography),
-                            CAST(t.point_geom AS geography)
-                        ) * 0.000621371 AS NUMERIC) AS distance_miles,
-                        p.type_,
-                        p.total_val_cents,
-                        p.assess_val_cents,
-                        p.land_val_cents,
-                        p.imp_val_cents,
-                        CAST(p.acre_area AS NUMERIC) AS acre_area,
-                        p.ow_name,
-                        p.ph_add,
-                        p.subdivname,
-                        p.geometry
-                    FROM properties p, target_property t
-                    WHERE ST_DWithin(
-                            CAST(ST_Transform(p.geometry, 4326) AS geography),
-                            CAST(t.point_geom AS geography),
-                            804.67  -- 0.5 miles in meters
-                        )
-                        AND p.type_ = t.type_
-                        AND p.total_val_cents BETWEEN t.total_val_cents * 0.80 AND t.total_val_cents * 1.20
-                        AND p.acre_area BETWEEN t.acre_area * 0.75 AND t.acre_area * 1.25
-                        AND p.total_val_cents > 0
-                        AND p.acre_area > 0
-                ),
-
-                scored_comparables AS (
-                    SELECT
-                        ac.parcel_id,
-                        ac.match_type,
-                        ac.distance_miles,
-                        ac.total_val_cents,
-                        ac.assess_val_cents,
-                        ac.land_val_cents,
-                        ac.imp_val_cents,
-                        ac.acre_area,
-                        ac.type_,
-                        ac.ow_name,
-                        ac.ph_add,
-                        ac.subdivname,
-
-                        -- Assessment ratio
-                        CASE
-                            WHEN ac.total_val_cents > 0 THEN
-                                ROUND(CAST(ac.assess_val_cents AS NUMERIC) / CAST(ac.total_val_cents AS NUMERIC) * 100, 2)
-                            ELSE CAST(0 AS NUMERIC)
-                        END AS assessment_ratio,
-
-                        -- Difference percentages
-                        ROUND(
-                            CAST(ABS(ac.total_val_cents - CAST(:total_val_cents AS BIGINT)) AS NUMERIC) /
-                            NULLIF(CAST(:total_val_cents AS NUMERIC), 0) * 100,
-                            2
-                        ) AS value_difference_pct,
-
-                        ROUND(
-                            ABS(ac.acre_area - CAST(:acreage AS NUMERIC)) /
-                            NULLIF(CAST(:acreage AS NUMERIC), 0) * 100,
-                            2
-                        ) AS acreage_difference_pct,
-
-                        -- Score components (all cast to NUMERIC for ROUND)
-                        CAST(100.0 AS NUMERIC) AS type_match_score,
-
-                        GREATEST(CAST(0 AS NUMERIC), CAST(100 AS NUMERIC) - (
-                            CAST(ABS(ac.total_val_cents - CAST(:total_val_cents AS BIGINT)) AS NUMERIC) /
-                            NULLIF(CAST(:total_val_cents AS NUMERIC), 0) * 100 * 5
-                        )) AS value_match_score,
-
-                        GREATEST(CAST(0 AS NUMERIC), CAST(100 AS NUMERIC) - (
-                            ABS(ac.acre_area - CAST(:acreage AS NUMERIC)) /
-                            NULLIF(CAST(:acreage AS NUMERIC), 0) * 100 * 4
-                        )) AS acreage_match_score,
-
-                        CASE
-                            WHEN ac.match_type = 'SUBDIVISION' THEN CAST(100.0 AS NUMERIC)
-                            WHEN ac.match_type = 'PROXIMITY' THEN
-                                GREATEST(CAST(0 AS NUMERIC), CAST(100 AS NUMERIC) - (ac.distance_miles * 200))
-                            ELSE CAST(0 AS NUMERIC)
-                        END AS location_score
-                    FROM all_candidates ac
-                )
-
-                SELECT
-                    sc.parcel_id AS comparable_parcelid,
-                    sc.match_type,
-                    ROUND(sc.distance_miles, 3) AS distance_miles,
-
-                    -- Weighted similarity score
-                    ROUND(
-                        (sc.type_match_score * 0.10) +
-                        (sc.value_match_score * 0.35) +
-                        (sc.acreage_match_score * 0.30) +
-                        (sc.location_score * 0.25),
-                        2
-                    ) AS similarity_score,
-
-                    sc.total_val_cents AS total_value,
-                    sc.assess_val_cents AS assess_value,
-                    sc.land_val_cents AS land_value,
-                    sc.imp_val_cents AS imp_value,
-                    ROUND(sc.acre_area, 2) AS acre_area,
-                    sc.type_ AS property_type,
-                    sc.ow_name AS owner_name,
-                    sc.ph_add AS property_address,
-                    sc.subdivname AS subdivision,
-                    sc.assessment_ratio,
-                    sc.value_difference_pct,
-                    sc.acreage_difference_pct,
-                    ROUND(sc.type_match_score, 2) AS type_match_score,
-                    ROUND(sc.value_match_score, 2) AS value_match_score,
-                    ROUND(sc.acreage_match_score, 2) AS acreage_match_score,
-                    ROUND(sc.location_score, 2) AS location_score
-
-                FROM scored_comparables sc
-                ORDER BY similarity_score DESC, sc.distance_miles ASC
-                LIMIT :limit
-            """)
-
             with self._get_connection() as conn:
                 result = conn.execute(
-                    query,
+                    _FIND_COMPARABLES_BY_CRITERIA_SQL,
                     {
                         "property_type": criteria.property_type,
                         "total_val_cents": criteria.total_val_cents,
@@ -725,10 +969,12 @@ class ComparableService:
 
             comparables = [self._row_to_comparable(row) for row in rows]
 
-            logger.info(
-                f"Found {len(comparables)} comparables by criteria. "
-                f"Avg similarity: {sum(c.similarity_score for c in comparables) / len(comparables):.1f}%"
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Found %d comparables by criteria. Avg similarity: %.1f%%",
+                    len(comparables),
+                    sum(c.similarity_score for c in comparables) / len(comparables),
+                )
 
             return comparables
 
@@ -739,12 +985,15 @@ class ComparableService:
             logger.error(f"Unexpected error finding comparables by criteria: {e}")
             raise ServiceError(f"Service error: {str(e)}") from e
 
-    def get_property_summary(self, property_id: str) -> Dict[str, Any]:
+    def get_property_summary(self, property_id: str, limit: int = 20) -> Dict[str, Any]:
         """
         Get a summary of a property including its comparables.
 
+        The property details and comparables are loaded with a single query.
+
         Args:
             property_id: The parcel ID to analyze
+            limit: Maximum number of comparables to summarize (1-50)
 
         Returns:
             Dictionary containing property info and comparable statistics
@@ -755,43 +1004,32 @@ class ComparableService:
         """
         logger.info(f"Getting property summary for {property_id}")
 
-        try:
-            # Get property details
-            property_query = text("""
-                SELECT
-                    parcel_id,
-                    type_ AS property_type,
-                    total_val_cents,
-                    assess_val_cents,
-                    acre_area,
-                    ph_add AS address,
-                    subdivname AS subdivision,
-                    ow_name AS owner_name,
-                    CASE
-                        WHEN total_val_cents > 0 THEN
-                            ROUND((assess_val_cents::NUMERIC / total_val_cents::NUMERIC) * 100, 2)
-                        ELSE 0
-                    END AS assessment_ratio
-                FROM properties
-                WHERE parcel_id = :parcel_id
-            """)
-
-            with self._get_connection() as conn:
-                result = conn.execute(property_query, {"parcel_id": property_id})
-                property_row = result.fetchone()
-
-            if not property_row:
-                raise PropertyNotFoundError(property_id)
+        if not 1 <= limit <= 50:
+            raise ValueError("limit must be between 1 and 50")
 
-            # Get comparables
-            comparables = self.find_comparables(property_id)
+        try:
+            # Get property details and comparables
+            property_row = self._cache.get(("summary", property_id))
+            comparables = self._cache.get(("comparables", property_id, limit))
+            if property_row is None or comparables is None:
+                property_row, comparables = self._fetch_property_summary(property_id, limit)
+            else:
+                comparables = list(comparables)
 
             # Calculate statistics
             if comparables:
-                avg_assessment_ratio = sum(c.assessment_ratio for c in comparables) / len(comparables)
-                avg_similarity = sum(c.similarity_score for c in comparables) / len(comparables)
-                subdivision_count = sum(1 for c in comparables if c.is_subdivision_match)
-                proximity_count = sum(1 for c in comparables if c.is_proximity_match)
+                # Accumulate every statistic in one pass over the comparables
+                ratio_total = similarity_total = 0.0
+                subdivision_count = proximity_count = 0
+                for c in comparables:
+                    ratio_total += c.assessment_ratio
+                    similarity_total += c.similarity_score
+                    if c.is_subdivision_match:
+                        subdivision_count += 1
+                    elif c.is_proximity_match:
+                        proximity_count += 1
+                avg_assessment_ratio = ratio_total / len(comparables)
+                avg_similarity = similarity_total / len(comparables)
 
                 target_ratio = float(property_row.assessment_ratio) if property_row.assessment_ratio else 0.0
                 ratio_diff = target_ratio - avg_assessment_ratio
@@ -864,44 +1102,52 @@ class ComparableService:
 
             return no_op()
 
-    def _property_exists(self, property_id: str) -> bool:
-        """Check if a property exists in the database."""
-        query = text("""
-            SELECT 1
-            FROM properties
-            WHERE parcel_id = :parcel_id
-            LIMIT 1
-        """)
+    def _fetch_property_summary(
+        self,
+        property_id: str,
+        limit: int
+    ) -> Tuple[_PropertySummaryRow, List[ComparableProperty]]:
+        """
+        Load a property's summary columns and comparables with one query, caching both.
 
+        Raises:
+            PropertyNotFoundError: If the property doesn't exist
+        """
+        property_row = None
+        comparables = []
         with self._get_connection() as conn:
-            result = conn.execute(query, {"parcel_id": property_id})
-            return result.fetchone() is not None
+            # Consume rows as they are read rather than materializing the rowset first
+            for row in conn.execute(_GET_PROPERTY_SUMMARY_SQL, {"parcel_id": property_id, "limit": limit}):
+                if property_row is None:
+                    property_row = _PropertySummaryRow(
+                        *(getattr(row, f"subject_{name}") for name in _PropertySummaryRow._fields)
+                    )
+                if row.comparable_parcelid is not None:
+                    comparables.append(self._row_to_comparable(row))
+
+        if property_row is None:
+            raise PropertyNotFoundError(property_id)
+
+        self._cache.set(("summary", property_id), property_row)
+        self._cache.set(("comparables", property_id, limit), tuple(comparables))
+        self._cache.set(("exists", property_id), True)
+        return property_row, comparables
+
+    def _property_exists(self, property_id: str, conn: Optional[Connection] = None) -> bool:
+        """Check if a property exists in the database, reusing ``conn`` if given."""
+        exists = self._cache.get(("exists", property_id))
+        if exists is None:
+            if conn is None:
+                with self._get_connection() as conn:
+                    return self._property_exists(property_id, conn)
+            result = conn.execute(_PROPERTY_EXISTS_SQL, {"parcel_id": property_id})
+            exists = result.fetchone() is not None
+            self._cache.set(("exists", property_id), exists)
+        return exists
 
     def _row_to_comparable(self, row) -> ComparableProperty:
         """Convert a database row to a ComparableProperty object."""
-        return ComparableProperty(
-            id=row.comparable_parcelid,
-            parcel_id=row.comparable_parcelid,
-            address=row.property_address or "",
-            total_val_cents=int(row.total_value),
-            assess_val_cents=int(row.assess_value),
-            land_val_cents=int(row.land_value) if row.land_value else 0,
-            imp_val_cents=int(row.imp_value) if row.imp_value else 0,
-            assessment_ratio=float(row.assessment_ratio),
-            acreage=float(row.acre_area),
-            property_type=row.property_type,
-            subdivision=row.subdivision,
-            owner_name=row.owner_name,
-            distance_miles=float(row.distance_miles),
-            match_type=row.match_type,
-            similarity_score=float(row.similarity_score),
-            value_difference_pct=float(row.value_difference_pct),
-            acreage_difference_pct=float(row.acreage_difference_pct),
-            type_match_score=float(row.type_match_score),
-            value_match_score=float(row.value_match_score),
-            acreage_match_score=float(row.acreage_match_score),
-            location_score=float(row.location_score),
-        )
+        return ComparableProperty(*_COMPARABLE_COLUMNS(row))
 
     def _get_fairness_explanation(
         self,
@@ -28,12 +28,14 @@ The scoring is from the TAXPAYER'S perspective:
 """
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Sequence, Union
 import statistics
 import math
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class FairnessResult:
     """
     Result of fairness assessment using sales comparison method.
@@ -119,6 +121,9 @@ class FairnessScorer:
     # Assessment ratio used by county (uniform 20%)
     ASSESSMENT_RATIO = 0.20
 
+    # Same ratio as an integer percentage, for exact integer-cent tax math
+    ASSESSMENT_RATIO_PCT = 20
+
     def __init__(self, mill_rate: float = DEFAULT_MILL_RATE):
         """
         Initialize the scorer.
@@ -131,7 +136,7 @@ class FairnessScorer:
     def calculate_fairness_score(
         self,
         subject_value: int,
-        comparable_values: List[int],
+        comparable_values: Union[Sequence[int], np.ndarray],
         subject_characteristics: Optional[dict] = None
     ) -> Optional[FairnessResult]:
         """
@@ -144,32 +149,40 @@ class FairnessScorer:
 
         Args:
             subject_value: Subject property's total_val_cents
-            comparable_values: List of comparable properties' total_val_cents
+            comparable_values: Comparable properties' total_val_cents, as a list
+                or an int64 NumPy array
             subject_characteristics: Optional dict with additional property info
 
         Returns:
             FairnessResult with score and analysis, or None if insufficient data
         """
         # Validate inputs
-        if not comparable_values or len(comparable_values) == 0:
+        if comparable_values is None or len(comparable_values) == 0:
             return None
 
         if subject_value <= 0:
             return None
 
-        # Filter out invalid values
-        valid_values = [v for v in comparable_values if v > 0]
+        # Filter out invalid values; sorted once so the median and percentile
+        # below are index lookups rather than separate passes over the array
+        values = np.asarray(comparable_values, dtype=np.int64)
+        valid_values = np.sort(values[values > 0])
+        count = len(valid_values)
 
-        if len(valid_values) == 0:
+        if count == 0:
             return None
 
-        # Calculate statistical measures
-        median_value = int(statistics.median(valid_values))
-        mean_value = int(statistics.mean(valid_values))
+        # Calculate statistical measures (mean in exact integer arithmetic)
+        mid = count // 2
+        if count % 2:
+            median_value = int(valid_values[mid])
+        else:
+            median_value = int((int(valid_values[mid - 1]) + int(valid_values[mid])) / 2)
+        mean_value = int(valid_values.sum()) // count
 
         # Calculate standard deviation
-        if len(valid_values) >= 2:
-            std_deviation = int(statistics.stdev(valid_values))
+        if count >= 2:
+            std_deviation = int(np.std(valid_values, ddof=1))
         else:
             # Only one comparable, use a default std dev (10% of median)
             std_deviation = int(median_value * 0.10)
@@ -181,8 +194,10 @@ class FairnessScorer:
         # Calculate z-score (how many std devs above/below median)
         z_score = (subject_value - median_value) / std_deviation
 
-        # Calculate percentile (where subject falls among comparables)
-        percentile = self._calculate_percentile(subject_value, valid_values)
+        # Calculate percentile (where subject falls among comparables), midpoint for ties
+        count_below = int(np.searchsorted(valid_values, subject_value, side="left"))
+        count_at_or_below = int(np.searchsorted(valid_values, subject_value, side="right"))
+        percentile = ((count_below + (count_at_or_below - count_below) / 2) / count) * 100
 
         # Calculate fairness score (0-100, higher = fairer)
         # If at or below median: score = 100 (fair)
@@ -205,16 +220,19 @@ class FairnessScorer:
             over_assessment_cents = subject_value - median_value
             # Potential tax savings if value reduced to median:
             # savings = (over_assessment * assessment_ratio * mill_rate / 1000)
-            potential_savings_cents = int(
-                over_assessment_cents * self.ASSESSMENT_RATIO * self.mill_rate / 1000
-            )
+            # Computed in integer cents with the mill rate in hundredths of a mill,
+            # so the result is exact and never touches float or Decimal math.
+            mill_rate_hundredths = int(round(self.mill_rate * 100))
+            potential_savings_cents = (
+                over_assessment_cents * self.ASSESSMENT_RATIO_PCT * mill_rate_hundredths
+            ) // 10_000_000
         else:
             over_assessment_cents = 0
             potential_savings_cents = 0
 
         # Calculate confidence
         confidence = self._calculate_confidence(
-            len(valid_values), std_deviation, median_value
+            count, std_deviation, median_value
         )
 
         return FairnessResult(
@@ -227,35 +245,11 @@ class FairnessScorer:
             percentile=percentile,
             interpretation=interpretation,
             confidence=confidence,
-            comparable_count=len(valid_values),
+            comparable_count=count,
             over_assessment_cents=over_assessment_cents,
             potential_annual_savings_cents=potential_savings_cents
         )
 
-    def _calculate_percentile(self, subject_value: int, comparable_values: List[int]) -> float:
-        """
-        Calculate the percentile rank of the subject property among comparables.
-
-        Higher percentile = property value is higher than more comparables
-        - 50th percentile = at median
-        - 90th percentile = higher than 90% of comparables (may be over-assessed)
-        - 10th percentile = lower than 90% of comparables (likely fair)
-
-        Args:
-            subject_value: The subject property's value
-            comparable_values: List of comparable values
-
-        Returns:
-            Percentile (0-100)
-        """
-        count_below = sum(1 for v in comparable_values if v < subject_value)
-        count_equal = sum(1 for v in comparable_values if v == subject_value)
-
-        # Use midpoint method for ties
-        percentile = ((count_below + (count_equal / 2)) / len(comparable_values)) * 100
-
-        return percentile
-
     def _interpret_score(self, fairness_score: int) -> str:
         """
         Interpret the fairness score into a category.
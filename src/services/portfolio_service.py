@@ -797,6 +797,7 @@ class BulkAnalysisService:
         start_time = time.time()
 
         result = AnalysisResult()
+        completed = []
 
         with self.engine.connect() as conn:
             # Get portfolio properties
@@ -813,12 +814,7 @@ class BulkAnalysisService:
                 try:
                     analysis = self.analyzer.analyze_property(prop["parcel_id"])
                     if analysis:
-                        # Save analysis to database so it persists
-                        try:
-                            self.analyzer.save_analysis(analysis)
-                        except Exception as save_err:
-                            logger.warning(f"Failed to save analysis for {prop['parcel_id']}: {save_err}")
-
+                        completed.append(analysis)
                         result.analyzed_count += 1
                         if analysis.recommended_action == "APPEAL":
                             result.appeal_candidates += 1
@@ -830,6 +826,14 @@ class BulkAnalysisService:
                     logger.error(f"Error analyzing property {prop['parcel_id']}: {e}")
                     result.error_count += 1
 
+        # Save analyses to database so they persist; rows that cannot be saved are logged and skipped
+        try:
+            saved = self.analyzer.save_analyses(completed)
+            if saved < len(completed):
+                logger.warning(f"Saved {saved} of {len(completed)} portfolio analyses")
+        except Exception as save_err:
+            logger.warning(f"Failed to save {len(completed)} portfolio analyses: {save_err}")
+
         result.duration_seconds = round(time.time() - start_time, 2)
         return result
 
@@ -0,0 +1,76 @@
+"""
+Unit tests for the AppealGenerator service.
+
+Tests cover:
+- Batch generation statistics
+- Streaming batch output to JSONL
+- Dollar formatting of integer cents
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.services import AppealGenerator
+from src.services.appeal_generator import _format_dollars
+from src.services.appeal_models import AppealPackage
+
+
+@pytest.fixture
+def appeal_generator(mock_db_engine):
+    """AppealGenerator instance with mocked database."""
+    return AppealGenerator(mock_db_engine)
+
+
+def _package(parcel_id: str, savings_cents: int) -> AppealPackage:
+    return AppealPackage(parcel_id=parcel_id, estimated_annual_savings_cents=savings_cents)
+
+
+class TestGenerateBatch:
+    """Test batch appeal generation."""
+
+    def test_batch_keeps_appeals_in_memory_by_default(self, appeal_generator):
+        """Without an output path, generated packages are returned in result.appeals."""
+        packages = [_package("01-00001-000", 1000), None]
+
+        with patch.object(appeal_generator, "generate_appeal", side_effect=packages):
+            result = appeal_generator.generate_batch(["01-00001-000", "01-00002-000"])
+
+        assert result.generated == 1
+        assert result.skipped == 1
+        assert result.total_potential_savings_cents == 1000
+        assert [p.parcel_id for p in result.appeals] == ["01-00001-000"]
+
+    def test_batch_streams_appeals_to_jsonl(self, appeal_generator, tmp_path):
+        """With an output path, packages are written per line and not retained."""
+        output_path = tmp_path / "appeals.jsonl"
+        packages = [_package("01-00001-000", 1000), _package("01-00002-000", 2500)]
+
+        with patch.object(appeal_generator, "generate_appeal", side_effect=packages):
+            result = appeal_generator.generate_batch(
+                ["01-00001-000", "01-00002-000"], output_path=output_path
+            )
+
+        assert result.appeals == []
+        assert result.generated == 2
+        assert result.total_potential_savings_cents == 3500
+        assert result.output_path == output_path
+
+        lines = output_path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["parcel_id"] for line in lines] == ["01-00001-000", "01-00002-000"]
+
+
+class TestFormatDollars:
+    """Test dollar formatting used in letters and summaries."""
+
+    @pytest.mark.parametrize("cents,expected", [
+        (0, "$0.00"),
+        (5, "$0.05"),
+        (123456, "$1,234.56"),
+        (100000000, "$1,000,000.00"),
+        (-150, "$-1.50"),
+    ])
+    def test_matches_float_formatting(self, cents, expected):
+        """Output matches the previous f"${cents / 100:,.2f}" formatting."""
+        assert _format_dollars(cents) == expected
@@ -0,0 +1,87 @@
+"""
+Unit tests for the appeal generation data models.
+
+Tests cover:
+- AppealPackage defaults and identifiers
+- Shared batch timestamps
+- BatchAppealResult statistics
+- GeneratorConfig validation
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.services.appeal_models import (
+    AppealPackage,
+    BatchAppealResult,
+    GeneratorConfig,
+    TemplateStyle,
+    batch_timestamp,
+)
+
+
+class TestBatchTimestamp:
+    """Test shared generation timestamps for batch runs."""
+
+    def test_packages_share_batch_timestamp(self):
+        """Packages built inside a batch reuse the batch's timestamp."""
+        result = BatchAppealResult(total_requested=2)
+
+        with batch_timestamp(result.generated_at):
+            first = AppealPackage(parcel_id="01-00001-000")
+            second = AppealPackage(parcel_id="01-00002-000")
+
+        assert first.generated_at is result.generated_at
+        assert second.generated_at is result.generated_at
+
+    def test_timestamp_resets_after_batch(self):
+        """Packages built after the batch get a fresh timestamp."""
+        batch_time = datetime(2020, 1, 1, 12, 0, 0)
+
+        with batch_timestamp(batch_time):
+            pass
+
+        package = AppealPackage(parcel_id="01-00001-000")
+        assert package.generated_at != batch_time
+
+    def test_explicit_timestamp_wins(self):
+        """An explicit generated_at is never overridden by the batch timestamp."""
+        explicit = datetime(2021, 6, 1)
+
+        with batch_timestamp(datetime(2020, 1, 1)):
+            package = AppealPackage(generated_at=explicit)
+
+        assert package.generated_at == explicit
+
+
+class TestAppealPackagePreview:
+    """Test letter previews used by diagnostics."""
+
+    def test_short_letter_returned_unchanged(self):
+        """Letters within the limit are returned as-is."""
+        package = AppealPackage(appeal_letter_text="Dear Board,")
+        assert package.preview(2000) == "Dear Board,"
+
+    def test_long_letter_truncated_with_marker(self):
+        """Letters over the limit are cut and marked as truncated."""
+        package = AppealPackage(appeal_letter_text="x" * 50)
+        preview = package.preview(10)
+
+        assert preview.startswith("x" * 10)
+        assert preview.endswith("... [truncated]")
+        assert "x" * 11 not in preview
+
+
+class TestGeneratorConfig:
+    """Test GeneratorConfig validation."""
+
+    def test_template_style_coerced_to_enum(self):
+        """String styles are converted to TemplateStyle at construction."""
+        config = GeneratorConfig(template_style="detailed")
+        assert config.template_style is TemplateStyle.DETAILED
+
+    def test_invalid_template_style_rejected(self):
+        """Unknown styles fail at construction rather than at letter time."""
+        with pytest.raises(ValueError):
+            GeneratorConfig(template_style="casual")
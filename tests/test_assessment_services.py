@@ -16,6 +16,9 @@ Test categories:
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime
+import dataclasses
+import json
+import pickle
 import statistics
 
 from src.services import (
@@ -33,6 +36,56 @@ from src.services import (
     AssessmentAnalysis,
 )
 
+from src.services.assessment_analyzer import _PropertyRecord
+
+
+def _make_property_record(sample_property, **overrides):
+    """Build a _PropertyRecord from the sample_property fixture."""
+    fields = dict(
+        id=sample_property["id"],
+        parcel_id=sample_property["parcel_id"],
+        address=sample_property["address"],
+        total_val_cents=sample_property["total_val_cents"],
+        assess_val_cents=sample_property["assess_val_cents"],
+        acreage=sample_property["acreage"],
+        owner_name=sample_property["owner_name"],
+    )
+    fields.update(overrides)
+    return _PropertyRecord(**fields)
+
+
+def _make_analysis(sample_property, **overrides):
+    """Build a fair, no-action AssessmentAnalysis for sample_property."""
+    fields = dict(
+        property_id=sample_property["id"],
+        parcel_id=sample_property["parcel_id"],
+        address=sample_property["address"],
+        total_val_cents=sample_property["total_val_cents"],
+        assess_val_cents=sample_property["assess_val_cents"],
+        current_ratio=0.20,
+        fairness_score=30,
+        confidence=85,
+        interpretation="FAIR",
+        comparable_count=10,
+        median_comparable_value_cents=sample_property["total_val_cents"],
+        estimated_annual_savings_cents=0,
+        estimated_five_year_savings_cents=0,
+        recommended_action="NONE",
+        analysis_date=datetime.now(),
+    )
+    fields.update(overrides)
+    return AssessmentAnalysis(**fields)
+
+
+# Overrides for an over-assessed analysis recommending an appeal
+_APPEAL_FIELDS = dict(
+    fairness_score=40,
+    confidence=80,
+    interpretation="OVER_ASSESSED",
+    estimated_annual_savings_cents=10000,
+    estimated_five_year_savings_cents=50000,
+    recommended_action="APPEAL",
+)
 
 
 # ============================================================================
@@ -118,7 +171,8 @@ class TestComparableServiceFindComparables:
         # Mock property_exists check returning False
         mock_conn = comparable_service.db.connect.return_value.__enter__.return_value
         mock_conn.execute.side_effect = [
-            mock_result,  # First call: find_comparables returns empty
+            mock_result,  # First call: subdivision branch returns empty
+            mock_result,  # Second call: proximity branch returns empty
             Mock(fetchone=Mock(return_value=None))  # Second call: property_exists returns False
         ]
 
@@ -138,7 +192,8 @@ class TestComparableServiceFindComparables:
 
         mock_conn = comparable_service.db.connect.return_value.__enter__.return_value
         mock_conn.execute.side_effect = [
-            mock_result,  # find_comparables returns empty
+            mock_result,  # subdivision branch returns empty
+            mock_result,  # proximity branch returns empty
             Mock(fetchone=Mock(return_value=Mock()))  # property_exists returns True
         ]
 
@@ -147,6 +202,82 @@ class TestComparableServiceFindComparables:
 
         # Assert - should return empty list, not raise error
         assert comparables == []
+        # The existence check shares the comparables query's connection
+        assert comparable_service.db.connect.call_count == 1
+
+    def test_find_comparables_cached_until_invalidated(self, comparable_service):
+        """Test repeat lookups are served from the cache until invalidated."""
+        mock_conn = comparable_service.db.connect.return_value.__enter__.return_value
+        mock_conn.execute.side_effect = lambda query, params: (
+            Mock(fetchall=Mock(return_value=[])) if "limit" in params
+            else Mock(fetchone=Mock(return_value=Mock()))
+        )
+
+        assert comparable_service.find_comparables("01-ISOLATED-000") == []
+        assert comparable_service.find_comparables("01-ISOLATED-000") == []
+        assert mock_conn.execute.call_count == 3  # two comparables branches + existence check
+
+        comparable_service.invalidate("01-ISOLATED-000")
+        comparable_service.find_comparables("01-ISOLATED-000")
+        assert mock_conn.execute.call_count == 6
+
+    def test_find_comparables_cache_disabled_with_zero_ttl(self, mock_db_engine):
+        """Test a zero cache TTL sends every lookup to the database."""
+        from src.services.comparable_service import ComparableConfig
+        service = ComparableService(mock_db_engine, ComparableConfig(cache_ttl_seconds=0))
+        mock_conn = mock_db_engine.connect.return_value.__enter__.return_value
+        mock_conn.execute.side_effect = lambda query, params: (
+            Mock(fetchall=Mock(return_value=[])) if "limit" in params
+            else Mock(fetchone=Mock(return_value=Mock()))
+        )
+
+        service.find_comparables("01-ISOLATED-000")
+        service.find_comparables("01-ISOLATED-000")
+        assert mock_conn.execute.call_count == 6
+
+    def test_find_comparables_skips_proximity_when_subdivision_fills_limit(
+        self, comparable_service
+    ):
+        """Test the proximity branch only runs when subdivision matches fall short."""
+        rows = [Mock(similarity_score=90.0), Mock(similarity_score=85.0)]
+        mock_conn = comparable_service.db.connect.return_value.__enter__.return_value
+        mock_conn.execute.return_value = Mock(fetchall=Mock(return_value=rows))
+
+        comparables = comparable_service.find_comparables("16-26005-000", limit=2)
+        assert len(comparables) == 2
+        assert mock_conn.execute.call_count == 1
+
+        comparable_service.find_comparables("16-26005-000", limit=5)
+        assert mock_conn.execute.call_count == 3
+        _, params = mock_conn.execute.call_args.args
+        assert params["limit"] == 3
+
+    def test_property_summary_single_query(self, comparable_service):
+        """Test property details and comparables are loaded with one query."""
+        row = Mock(
+            subject_parcel_id="01-ISOLATED-000",
+            subject_property_type="RI",
+            subject_total_val_cents=25000000,
+            subject_assess_val_cents=5000000,
+            subject_acre_area=0.25,
+            subject_address="1 Remote Rd",
+            subject_subdivision=None,
+            subject_owner_name="Owner",
+            subject_assessment_ratio=20.0,
+            comparable_parcelid=None,
+        )
+        mock_conn = comparable_service.db.connect.return_value.__enter__.return_value
+        mock_conn.execute.return_value = [row]
+
+        summary = comparable_service.get_property_summary("01-ISOLATED-000")
+
+        assert mock_conn.execute.call_count == 1
+        query, params = mock_conn.execute.call_args.args
+        assert "LEFT JOIN LATERAL" in str(query)
+        assert params == {"parcel_id": "01-ISOLATED-000", "limit": 20}
+        assert summary["property"]["parcel_id"] == "01-ISOLATED-000"
+        assert summary["comparables"]["count"] == 0
+        assert summary["assessment"]["fairness"] == "INSUFFICIENT_DATA"
 
     def test_find_comparables_invalid_limit_raises_error(self, comparable_service):
         """Test ValueError for invalid limit values."""
@@ -156,6 +287,90 @@ class TestComparableServiceFindComparables:
         with pytest.raises(ValueError, match="limit must be between 1 and 50"):
             comparable_service.find_comparables("01-12345-000", limit=51)
 
+    def test_find_comparables_bulk_groups_by_subject(self, comparable_service):
+        """Test bulk lookup runs one query and groups rows by subject parcel."""
+        def comparable_row(subject, parcel_id):
+            return Mock(
+                subject_parcel_id=subject, comparable_parcelid=parcel_id, property_address="1 Main St",
+                total_value=25000000, assess_value=5000000, land_value=7000000, imp_value=18000000,
+                assessment_ratio=20.0, acre_area=0.5, property_type="RES", subdivision="Test Subdivision",
+                owner_name="Owner", distance_miles=0.0, match_type="SUBDIVISION", similarity_score=90.0,
+                value_difference_pct=2.0, acreage_difference_pct=1.0, type_match_score=100.0,
+                value_match_score=98.0, acreage_match_score=99.0, location_score=100.0,
+            )
+
+        mock_conn = comparable_service.db.connect.return_value.__enter__.return_value
+        mock_conn.execute.return_value = Mock(fetchall=Mock(return_value=[
+            comparable_row("01-00001-000", "01-10001-000"),
+            comparable_row("01-00001-000", "01-10002-000"),
+            comparable_row("01-00002-000", "01-10003-000"),
+        ]))
+
+        comparables = comparable_service.find_comparables_bulk(
+            ["01-00001-000", "01-00002-000", "01-00003-000"], limit=5
+        )
+
+        assert mock_conn.execute.call_count == 1
+        assert [c.parcel_id for c in comparables["01-00001-000"]] == ["01-10001-000", "01-10002-000"]
+        assert [c.parcel_id for c in comparables["01-00002-000"]] == ["01-10003-000"]
+        assert comparables["01-00003-000"] == []
+
+    def test_find_comparables_bulk_deduplicates_parcels(self, comparable_service):
+        """Test a repeated parcel ID is queried once and never exceeds limit comparables."""
+        def comparable_row(parcel_id):
+            return Mock(
+                subject_parcel_id="01-00001-000", comparable_parcelid=parcel_id, property_address="1 Main St",
+                total_value=25000000, assess_value=5000000, land_value=7000000, imp_value=18000000,
+                assessment_ratio=20.0, acre_area=0.5, property_type="RES", subdivision="Test Subdivision",
+                owner_name="Owner", distance_miles=0.0, match_type="SUBDIVISION", similarity_score=90.0,
+                value_difference_pct=2.0, acreage_difference_pct=1.0, type_match_score=100.0,
+                value_match_score=98.0, acreage_match_score=99.0, location_score=100.0,
+            )
+
+        mock_conn = comparable_service.db.connect.return_value.__enter__.return_value
+        mock_conn.execute.return_value = Mock(fetchall=Mock(return_value=[
+            comparable_row("01-10001-000"), comparable_row("01-10002-000"),
+        ]))
+
+        comparables = comparable_service.find_comparables_bulk(["01-00001-000", "01-00001-000"], limit=2)
+
+        assert mock_conn.execute.call_args.args[1]["parcel_ids"] == ["01-00001-000"]
+        assert all(len(comps) <= 2 for comps in comparables.values())
+        assert len(comparable_service.find_comparables("01-00001-000", limit=2)) == 2
+
+    def test_find_comparables_bulk_fills_cache(self, comparable_service):
+        """Test bulk results are cached and reused by find_comparables and later bulk calls."""
+        row = Mock(
+            subject_parcel_id="01-00001-000", comparable_parcelid="01-10001-000", property_address="1 Main St",
+            total_value=25000000, assess_value=5000000, land_value=7000000, imp_value=18000000,
+            assessment_ratio=20.0, acre_area=0.5, property_type="RES", subdivision="Test Subdivision",
+            owner_name="Owner", distance_miles=0.0, match_type="SUBDIVISION", similarity_score=90.0,
+            value_difference_pct=2.0, acreage_difference_pct=1.0, type_match_score=100.0,
+            value_match_score=98.0, acreage_match_score=99.0, location_score=100.0,
+        )
+        mock_conn = comparable_service.db.connect.return_value.__enter__.return_value
+        mock_conn.execute.return_value = Mock(fetchall=Mock(return_value=[row]))
+
+        comparable_service.find_comparables_bulk(["01-00001-000", "01-00002-000"], limit=5)
+        comparable_service.find_comparables_bulk(["01-00001-000", "01-00002-000"], limit=5)
+        assert mock_conn.execute.call_count == 2
+        # Only the parcel without cached comparables is queried again
+        assert mock_conn.execute.call_args.args[1]["parcel_ids"] == ["01-00002-000"]
+
+        comparables = comparable_service.find_comparables("01-00001-000", limit=5)
+        assert [c.parcel_id for c in comparables] == ["01-10001-000"]
+        assert mock_conn.execute.call_count == 2
+
+    def test_comparable_is_frozen_and_slotted(self, comparable_property_objects):
+        """Test comparables are immutable, hashable slotted instances."""
+        comp = comparable_property_objects[0]
+
+        assert not hasattr(comp, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            comp.similarity_score = 0.0
+        assert hash(comp) == hash(dataclasses.replace(comp))
+        assert pickle.loads(pickle.dumps(comp)) == comp
+
     def test_similarity_scoring_calculation(
         self, comparable_service, sample_comparables
     ):
@@ -405,6 +620,8 @@ class TestFairnessScorer:
         assert "confidence" in result_dict
         assert "interpretation" in result_dict
         assert isinstance(result_dict["fairness_score"], int)
+        # Slotted dataclass: no per-instance __dict__
+        assert not hasattr(result, "__dict__")
 
     def test_get_recommendation(self, fairness_scorer):
         """Test recommendation generation based on fairness score."""
@@ -435,6 +652,32 @@ class TestFairnessScorer:
         if result_fair.fairness_score >= 70:
             assert result_fair.get_recommendation() == "NO_ACTION_NEEDED"
 
+    def test_potential_savings_exact_integer_cents(self):
+        """Test savings use exact integer math for fractional mill rates."""
+        scorer = FairnessScorer(mill_rate=65.35)
+        result = scorer.calculate_fairness_score(
+            subject_value=30000001,
+            comparable_values=[20000000, 22000000, 24000000, 26000000, 28000000]
+        )
+
+        # over_assessment * 20% * 65.35 / 1000, truncated to whole cents
+        assert result.over_assessment_cents == 6000001
+        assert result.potential_annual_savings_cents == 6000001 * 20 * 6535 // 10_000_000
+        assert isinstance(result.potential_annual_savings_cents, int)
+
+    def test_numpy_array_input_matches_list(self):
+        """Test an int64 array of comparables scores the same as a list."""
+        import numpy as np
+
+        scorer = FairnessScorer()
+        values = [20000000, 0, 22000000, 24000000, 26000000, 28000000]
+        from_list = scorer.calculate_fairness_score(27000000, values)
+        from_array = scorer.calculate_fairness_score(27000000, np.array(values, dtype=np.int64))
+
+        assert from_array == from_list
+        assert from_array.comparable_count == 5
+        assert from_array.median_value == 24000000
+
 
 # ============================================================================
 # SAVINGS ESTIMATOR TESTS
@@ -664,6 +907,21 @@ class TestAssessmentAnalyzer:
         assert recommendation == "NONE"
         assert strength is None
 
+    @pytest.mark.parametrize("score,over,savings,expected", [
+        (30, 1500000, 20000, ("APPEAL", "STRONG")),
+        (55, 600000, 6000, ("APPEAL", "MODERATE")),
+        (70, 100000, 1000, ("MONITOR", "WEAK")),
+        (95, 0, 0, ("NONE", None)),
+    ])
+    def test_recommendation_v2(self, assessment_analyzer, score, over, savings, expected):
+        """Test sales comparison recommendation thresholds (lower score = over-assessed)."""
+        assert assessment_analyzer._determine_recommendation_v2(
+            fairness_score=score,
+            confidence=80,
+            over_assessment_cents=over,
+            savings_cents=savings
+        ) == expected
+
     def test_batch_analysis(
         self, assessment_analyzer, sample_property, over_assessed_property
     ):
@@ -676,25 +934,26 @@ class TestAssessmentAnalyzer:
         # Mock database responses
         mock_conn = assessment_analyzer.db.connect.return_value.__enter__.return_value
 
-        # Create alternating responses for each property analysis
-        property_responses = []
-        for prop in [sample_property, over_assessed_property]:
-            property_row = Mock(
+        # One bulk property lookup and one bulk comparables lookup for the batch
+        property_rows = [
+            Mock(
                 id=prop["id"],
                 parcel_id=prop["parcel_id"],
                 address=prop["address"],
                 total_val_cents=prop["total_val_cents"],
                 assess_val_cents=prop["assess_val_cents"],
+                acre_area=prop["acreage"],
                 owner_name=prop["owner_name"]
             )
-            property_responses.append(Mock(fetchone=Mock(return_value=property_row)))
-
-            # Add mock comparables for each
-            comp_result = Mock()
-            comp_result.fetchall.return_value = []  # Empty for simplicity
-            property_responses.append(comp_result)
+            for prop in [sample_property, over_assessed_property]
+        ]
+        def execute(query, params):
+            if "limit" not in params and "parcel_ids" in params:
+                return Mock(fetchall=Mock(return_value=property_rows))
+            # No comparables, for simplicity; both properties exist
+            return Mock(fetchall=Mock(return_value=[]), fetchone=Mock(return_value=Mock()))
 
-        mock_conn.execute.side_effect = property_responses
+        mock_conn.execute.side_effect = execute
 
         # Execute batch analysis
         analyses = assessment_analyzer.analyze_batch(property_ids)
@@ -702,30 +961,173 @@ class TestAssessmentAnalyzer:
         # Should return list (may be empty if no comparables)
         assert isinstance(analyses, list)
 
-    def test_analysis_to_dict(
-        self, assessment_analyzer, sample_property, sample_comparables
+        # Property data for the whole batch comes from a single ANY(:parcel_ids) query
+        bulk_query, bulk_params = mock_conn.execute.call_args_list[0].args
+        assert "ANY(:parcel_ids)" in str(bulk_query)
+        assert bulk_params == {"parcel_ids": property_ids}
+
+        # Comparables for the whole batch come from a single LATERAL query
+        comps_query, comps_params = mock_conn.execute.call_args_list[1].args
+        assert "CROSS JOIN LATERAL" in str(comps_query)
+        assert comps_params == {"parcel_ids": property_ids, "limit": 20}
+
+        # Parcels without bulk comparables fall back to find_comparables' own checks
+        assert all("parcel_id" in call.args[1] for call in mock_conn.execute.call_args_list[2:])
+
+    @pytest.mark.parametrize("use_engine", [True, False])
+    def test_batch_analysis_collects_all_results(
+        self, mock_db_engine, mock_db_connection, use_engine
     ):
-        """Test AssessmentAnalysis serialization to dict."""
-        # Create a mock analysis
-        analysis = AssessmentAnalysis(
-            property_id=sample_property["id"],
+        """Test batch results are collected on both the threaded and sequential paths."""
+        analyzer = AssessmentAnalyzer(mock_db_engine if use_engine else mock_db_connection)
+        property_ids = ["01-00001-000", "01-00002-000", "01-00003-000"]
+        scores = {"01-00001-000": 40, "01-00002-000": 90}
+        analysis_dates = []
+
+        def fake_analyze(prop_id, property_data, min_score=None, analysis_date=None, include_comparables=True):
+            analysis_dates.append(analysis_date)
+            if prop_id not in scores:
+                raise RuntimeError("boom")
+            return Mock(fairness_score=scores[prop_id])
+
+        bulk_data = {pid: {"parcel_id": pid} for pid in property_ids}
+        with patch.object(analyzer, "_get_properties_bulk", return_value=bulk_data), \
+                patch.object(analyzer, "_analyze_from_data", side_effect=fake_analyze):
+            analyses = analyzer.analyze_batch(property_ids, max_workers=2)
+
+        # The failing property is skipped; the rest are sorted by fairness_score
+        assert [a.fairness_score for a in analyses] == [90, 40]
+        # Every property in the run is stamped with the same batch timestamp
+        assert len(analysis_dates) == 3
+        assert analysis_dates[0] is not None
+        assert len(set(analysis_dates)) == 1
+
+    def test_batch_results_drop_comparables(self, assessment_analyzer, sample_property):
+        """Test batch results keep only comparable summaries and can reload the list."""
+        comparables = [Mock(), Mock()]
+        fairness_result = Mock(
+            fairness_score=30, confidence=80, interpretation="OVER_ASSESSED",
+            median_value=20000000, over_assessment_cents=1500000
+        )
+        property_data = _make_property_record(sample_property)
+
+        analysis = assessment_analyzer._build_analysis(
+            sample_property["parcel_id"], property_data, comparables, fairness_result,
+            20000, "APPEAL", "STRONG", include_comparables=False
+        )
+
+        assert analysis.comparables == []
+        assert analysis.comparable_count == 2
+        assert analysis.median_comparable_value_cents == 20000000
+
+        service = Mock(find_comparables=Mock(return_value=comparables))
+        assert analysis.fetch_comparables(service) is comparables
+        service.find_comparables.assert_called_once_with(sample_property["parcel_id"], limit=20)
+
+    def test_default_workers_capped_by_pool_size(self, mock_db_engine, mock_db_connection):
+        """Test worker threads never outnumber the Engine's pooled connections."""
+        mock_db_engine.pool = Mock(size=Mock(return_value=5))
+        assert AssessmentAnalyzer(mock_db_engine)._default_workers(100) == 4
+        assert AssessmentAnalyzer(mock_db_engine)._default_workers(2) == 2
+
+        # Without a sized pool only the batch size and the hard cap apply
+        assert AssessmentAnalyzer(mock_db_connection)._default_workers(100) == 32
+
+    def test_batch_rows_prefetched_in_order(self, mock_db_engine):
+        """Test each batch's rows are fetched once, in order, while earlier batches analyze."""
+        analyzer = AssessmentAnalyzer(mock_db_engine)
+        property_ids = [f"01-0000{n}-000" for n in range(5)]
+
+        def fake_bulk(parcel_ids):
+            return {pid: {"parcel_id": pid} for pid in parcel_ids}
+
+        with patch.object(analyzer, "_get_properties_bulk", side_effect=fake_bulk) as bulk, \
+                patch.object(analyzer, "_analyze_from_data", return_value=Mock(fairness_score=50)):
+            analyses = analyzer.analyze_batch(property_ids, batch_size=2, max_workers=1)
+
+        assert [call.args[0] for call in bulk.call_args_list] == [
+            property_ids[0:2], property_ids[2:4], property_ids[4:5]
+        ]
+        assert len(analyses) == 5
+
+    def test_batch_properties_loaded_in_one_query(self, assessment_analyzer, sample_property):
+        """Test batch property rows come from one bulk query, first row per parcel."""
+        mock_conn = assessment_analyzer.db.connect.return_value.__enter__.return_value
+        property_row = Mock(
+            id=sample_property["id"],
             parcel_id=sample_property["parcel_id"],
             address=sample_property["address"],
             total_val_cents=sample_property["total_val_cents"],
             assess_val_cents=sample_property["assess_val_cents"],
-            current_ratio=0.20,
-            fairness_score=30,
-            confidence=85,
-            interpretation="FAIR",
-            comparable_count=10,
-            median_comparable_value_cents=sample_property["total_val_cents"],  # Median comparable market value in cents
-            estimated_annual_savings_cents=0,
-            estimated_five_year_savings_cents=0,
-            recommended_action="NONE",
-            appeal_strength=None,
-            analysis_date=datetime.now(),
-            model_version="1.0.0"
+            acre_area=sample_property["acreage"],
+            owner_name=sample_property["owner_name"],
         )
+        duplicate_row = Mock(parcel_id=sample_property["parcel_id"], address="Duplicate")
+        mock_conn.execute.return_value = Mock(
+            fetchall=Mock(return_value=[property_row, duplicate_row])
+        )
+
+        with patch.object(assessment_analyzer, "_prefetch_comparables"), \
+                patch.object(assessment_analyzer, "_analyze_from_data", return_value=None) as analyze:
+            assessment_analyzer.analyze_batch([sample_property["parcel_id"]], max_workers=1)
+
+        assert mock_conn.execute.call_count == 1
+        assert analyze.call_count == 1
+        assert analyze.call_args.args[1].address == sample_property["address"]
+
+    def test_comparables_served_by_service_cache(self, assessment_analyzer):
+        """Test the analyzer reads comparables through ComparableService and its cache."""
+        service = assessment_analyzer.comparable_service
+        service.find_comparables_bulk = Mock()
+
+        assessment_analyzer._prefetch_comparables(["01-00001-000"], 20)
+        service.find_comparables_bulk.assert_called_once_with(["01-00001-000"], limit=20)
+        assert assessment_analyzer._find_comparables == service.find_comparables
+
+        with patch.object(service, "invalidate") as invalidate:
+            assessment_analyzer.clear_caches()
+        invalidate.assert_called_once_with()
+
+    def test_find_appeal_candidates_analyzes_queried_parcels(self, assessment_analyzer):
+        """Test every queried parcel is analyzed, including those without a subdivision."""
+        mock_conn = assessment_analyzer.db.connect.return_value.__enter__.return_value
+        mock_conn.execute.return_value.scalars.return_value.all.return_value = ["01-00001-000"]
+
+        with patch.object(assessment_analyzer, "analyze_batch", return_value=[]) as analyze_batch:
+            assessment_analyzer.find_appeal_candidates(limit=5)
+
+        query, params = mock_conn.execute.call_args.args
+        assert "subdivision" not in str(query)
+        assert params == {"query_limit": 50}
+        analyze_batch.assert_called_once_with(["01-00001-000"], min_score=60)
+
+    def test_below_min_score_skips_recommendation(self, assessment_analyzer, sample_property):
+        """Test results below min_score are dropped before recommendation and build."""
+        property_data = _make_property_record(sample_property)
+        fairness_result = Mock(fairness_score=30, confidence=80, over_assessment_cents=0,
+                               potential_annual_savings_cents=0)
+        assessment_analyzer._find_comparables = Mock(return_value=[Mock(total_val_cents=20000000)])
+        assessment_analyzer._calc_fairness = Mock(return_value=fairness_result)
+
+        with patch.object(assessment_analyzer, "_determine_recommendation_v2",
+                          return_value=("NONE", None)) as recommend, \
+                patch.object(assessment_analyzer, "_build_analysis") as build:
+            assert assessment_analyzer._analyze_from_data(
+                sample_property["parcel_id"], property_data, min_score=60
+            ) is None
+            recommend.assert_not_called()
+            build.assert_not_called()
+
+            assessment_analyzer._analyze_from_data(sample_property["parcel_id"], property_data, min_score=20)
+            recommend.assert_called_once()
+            build.assert_called_once()
+
+    def test_analysis_to_dict(
+        self, assessment_analyzer, sample_property, sample_comparables
+    ):
+        """Test AssessmentAnalysis serialization to dict."""
+        # Create a mock analysis
+        analysis = _make_analysis(sample_property)
 
         result_dict = analysis.to_dict()
 
@@ -734,6 +1136,98 @@ class TestAssessmentAnalyzer:
         assert "recommended_action" in result_dict
         assert result_dict["fairness_score"] == 30
         assert result_dict["interpretation"] == "FAIR"
+        # Slotted dataclass: no per-instance __dict__, comparables default to empty list
+        assert not hasattr(analysis, "__dict__")
+        assert analysis.comparables == []
+
+        # Slotted instances still round-trip through pickle
+        restored = pickle.loads(pickle.dumps(analysis))
+        assert restored == analysis
+        assert restored.to_dict() == result_dict
+
+    def test_analysis_str_report(self, sample_property):
+        """Test the human-readable report includes the recommendation and strength."""
+        analysis = _make_analysis(
+            sample_property,
+            interpretation="OVER_ASSESSED",
+            median_comparable_value_cents=20000000,
+            estimated_annual_savings_cents=32500,
+            estimated_five_year_savings_cents=162500,
+            recommended_action="APPEAL",
+            appeal_strength="STRONG",
+            analysis_date=datetime(2024, 3, 1, 9, 30, 0),
+        )
+
+        lines = str(analysis).splitlines()
+
+        assert lines[0] == f"Assessment Analysis for {sample_property['address']}"
+        assert "Recommendation: APPEAL (STRONG case)" in lines
+        assert "Analysis Date: 2024-03-01 09:30:00" in lines
+        assert lines[-1] == "=" * 70
+
+    def test_analysis_date_strings_shared_across_batch(self, sample_property):
+        """Test analyses sharing a batch timestamp reuse the formatted date strings."""
+        batch_date = datetime(2024, 3, 1, 9, 30, 0)
+        analyses = [
+            _make_analysis(
+                sample_property, parcel_id=f"01-0000{i}-000", fairness_score=80,
+                analysis_date=batch_date,
+            )
+            for i in range(2)
+        ]
+
+        first, second = (a.to_dict()["analysis_date"] for a in analyses)
+
+        assert first == batch_date.isoformat()
+        assert first is second
+
+    def test_save_analyses_single_executemany(self, assessment_analyzer, sample_property):
+        """Test batch save sends all rows in one execute and commits once."""
+        mock_conn = assessment_analyzer.db.connect.return_value.__enter__.return_value
+        analyses = [
+            _make_analysis(
+                sample_property,
+                property_id=f"00000000-0000-0000-0000-00000000000{i}",
+                parcel_id=f"01-0000{i}-000",
+                **_APPEAL_FIELDS,
+            )
+            for i in range(3)
+        ]
+
+        assert assessment_analyzer.save_analyses(analyses) == 3
+
+        assert mock_conn.execute.call_count == 1
+        params = mock_conn.execute.call_args.args[1]
+        assert [str(p["property_id"]) for p in params] == [a.property_id for a in analyses]
+        assert json.loads(params[0]["analysis_parameters"])["parcel_id"] == analyses[0].parcel_id
+        mock_conn.commit.assert_called_once()
+
+    def test_save_analyses_skips_invalid_and_retries_rows(self, assessment_analyzer, sample_property):
+        """Test bad rows are skipped and a failed batch falls back to per-row saves."""
+        from sqlalchemy.exc import IntegrityError
+
+        def analysis(property_id):
+            return _make_analysis(sample_property, property_id=property_id, **_APPEAL_FIELDS)
+
+        good = "00000000-0000-0000-0000-000000000001"
+        rejected = "00000000-0000-0000-0000-000000000002"
+        analyses = [analysis(good), analysis("not-a-uuid"), analysis(rejected)]
+
+        def execute(query, params):
+            # The batch insert and the rejected row's own insert both fail
+            if isinstance(params, list) or str(params["property_id"]) == rejected:
+                raise IntegrityError("INSERT", params, Exception("constraint"))
+
+        mock_conn = assessment_analyzer.db.connect.return_value.__enter__.return_value
+        mock_conn.execute.side_effect = execute
+
+        assert assessment_analyzer.save_analyses(analyses) == 1
+
+        batch_params = mock_conn.execute.call_args_list[0].args[1]
+        assert [str(p["property_id"]) for p in batch_params] == [good, rejected]
+        assert mock_conn.execute.call_count == 3
+        assert mock_conn.rollback.call_count == 2
+        mock_conn.commit.assert_called_once()
 
     def test_analysis_invalid_property(self, assessment_analyzer):
         """Test analysis with invalid property ID."""